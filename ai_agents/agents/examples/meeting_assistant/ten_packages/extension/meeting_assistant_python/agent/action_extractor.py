@@ -1,93 +1,323 @@
+import asyncio
+import bisect
+import functools
+import io
+import itertools
 import re
-import uuid
+import secrets
+from collections import defaultdict
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Tuple
+from operator import attrgetter
+from typing import Callable, Dict, List, Optional, Tuple
 from ten_runtime import AsyncTenEnv
 from .events import ActionItem, ActionItemEvent
 from .llm_exec import LLMExec
 
+try:
+    import orjson
+except ImportError:  # stdlib json is the fallback in export_action_items
+    orjson = None
+
+try:
+    import ahocorasick
+except ImportError:  # pyahocorasick is optional; fall back to keyword scanning
+    ahocorasick = None
+
+try:
+    # RE2 compiles to a DFA and matches in linear time, which hardens the
+    # large alternations below against backtracking blowups on hostile input.
+    # No backreferences are used, so the patterns stay RE2-compatible.
+    import re2 as re_engine
+except ImportError:
+    re_engine = re
+
+
+def _compile(pattern: str, ignorecase: bool = False) -> re.Pattern:
+    """Compile through RE2 when available, else stdlib re.
+
+    google-re2 takes an re2.Options second argument, not re flags, so
+    case-insensitivity is expressed via options.case_sensitive. Patterns
+    RE2 rejects fall back to stdlib re.
+    """
+    if re_engine is re:
+        return re.compile(pattern, re.IGNORECASE if ignorecase else 0)
+    try:
+        if ignorecase:
+            options = re_engine.Options()
+            options.case_sensitive = False
+            return re_engine.compile(pattern, options)
+        return re_engine.compile(pattern)
+    except Exception:
+        return re.compile(pattern, re.IGNORECASE if ignorecase else 0)
+
+# Sort key for the per-meeting deadline-ordered action lists.
+_DEADLINE_KEY = attrgetter("deadline")
+
+# Fold full-width punctuation onto ASCII once per transcript turn so the hot
+# regexes below only need the ASCII variant instead of per-branch alternations.
+_NORMALIZE = str.maketrans({"：": ":", "，": ",", "。": ".", "—": "-"})
+
+# Action IDs: random per-process prefix plus a monotonic counter. Unique for
+# the lifetime of the process at a fraction of the cost of a uuid4 per action.
+_ID_PREFIX = secrets.token_hex(4)
+_id_counter = itertools.count()
+
 
 class ActionExtractor:
     """Extractor for identifying and processing action items from meeting content."""
 
+    _PRIORITY_KEYWORDS = {
+        "high": ["urgent", "紧急", "立即", "马上", "高优先级", "critical", "asap"],
+        "medium": ["important", "重要", "需要", "should", "建议"],
+        "low": ["可以", "later", "稍后", "有时间", "low priority", "optional"]
+    }
+
     def __init__(self, ten_env: AsyncTenEnv, llm_exec: LLMExec):
         self.ten_env = ten_env
         self.llm_exec = llm_exec
         self.action_items: Dict[str, List[ActionItem]] = {}
-        self.action_patterns = self._compile_action_patterns()
-        self.priority_keywords = {
-            "high": ["urgent", "紧急", "立即", "马上", "高优先级", "critical", "asap"],
-            "medium": ["important", "重要", "需要", "should", "建议"],
-            "low": ["可以", "later", "稍后", "有时间", "low priority", "optional"]
-        }
-        self.time_patterns = self._compile_time_patterns()
+        # Secondary index: meeting_id -> action_id -> ActionItem for O(1) lookups.
+        self._action_index: Dict[str, Dict[str, ActionItem]] = {}
+        # Running per-meeting counters so get_action_stats never rescans the
+        # action list; "overdue" is time-dependent and served from a
+        # deadline-sorted list of pending actions instead.
+        self._stats: Dict[str, Dict[str, int]] = {}
+        self._pending_deadlines: Dict[str, List[Tuple[datetime, str]]] = {}
+        # Actions that carry a deadline, kept sorted by deadline so overdue /
+        # this-week / next-week queries are bisect slices, not full scans.
+        self._by_deadline: Dict[str, List[ActionItem]] = {}
+        # The compiled patterns and keyword scanners are process-wide
+        # singletons (functools.cache below), so per-meeting extractor
+        # instances share them instead of recompiling ~20 regexes each.
+        self._master_pattern, self._handlers = self._compile_action_patterns()
+        self.priority_keywords = self._PRIORITY_KEYWORDS
+        self._priority_acs = self._build_priority_automatons()
+        self._prio_regex, self._prio_group_to_prio = self._compile_priority_regex()
+        self._time_master, self._time_handlers = self._compile_time_patterns()
+        # Micro-batcher for LLM extraction; created lazily on first use so a
+        # running event loop is guaranteed.
+        self._llm_batch_queue: Optional[asyncio.Queue] = None
+        self._llm_batch_task: Optional[asyncio.Task] = None
+
+    @staticmethod
+    @functools.cache
+    def _compile_priority_regex() -> Tuple[re.Pattern, Dict[str, str]]:
+        """Compile priority keywords into one union regex with tagged groups.
+
+        Fallback scanner for when pyahocorasick is unavailable: a single
+        IGNORECASE pass replaces one substring scan per keyword and avoids
+        lowercasing a copy of the text.
+        """
+        group_to_priority = {}
+        parts = []
+        for priority, keywords in ActionExtractor._PRIORITY_KEYWORDS.items():
+            for i, keyword in enumerate(keywords):
+                group = f"p_{priority}_{i}"
+                group_to_priority[group] = priority
+                parts.append(f"(?P<{group}>{re.escape(keyword)})")
+        return re.compile("|".join(parts), re.IGNORECASE), group_to_priority
+
+    @staticmethod
+    @functools.cache
+    def _build_priority_automatons():
+        """Build Aho-Corasick automatons mapping priority keywords to priorities.
+
+        One O(len(text)) automaton pass replaces a separate substring scan per
+        keyword. Keywords are split by script: the CJK automaton runs over the
+        raw text (case-free), so all-CJK transcripts never pay for a lowered
+        copy; the ASCII automaton runs against text.lower() only as a second
+        step. Returns None when pyahocorasick is not installed.
+        """
+        if ahocorasick is None:
+            return None
 
-    def _compile_action_patterns(self) -> List[re.Pattern]:
-        """Compile regex patterns for action item detection."""
-        patterns = [
+        cjk_automaton = ahocorasick.Automaton()
+        ascii_automaton = ahocorasick.Automaton()
+        for priority, keywords in ActionExtractor._PRIORITY_KEYWORDS.items():
+            for keyword in keywords:
+                if keyword.isascii():
+                    ascii_automaton.add_word(keyword.lower(), priority)
+                else:
+                    cjk_automaton.add_word(keyword, priority)
+        cjk_automaton.make_automaton()
+        ascii_automaton.make_automaton()
+        return cjk_automaton, ascii_automaton
+
+    @staticmethod
+    @functools.cache
+    def _compile_action_patterns() -> Tuple[re.Pattern, Dict[str, Callable]]:
+        """Compile action patterns into a single alternation regex with named groups.
+
+        Fusing the patterns means the text is scanned once instead of once per
+        pattern; dispatch back to the matching pattern happens via `lastgroup`.
+        Cached so the compile cost is paid once per process, not per instance.
+        """
+        raw_patterns = [
             # Direct action assignments
-            re.compile(r'(.+?)(负责|will\s+do|needs?\s+to|should|要|需要)(.+)', re.IGNORECASE),
-            # Task descriptions
-            re.compile(r'(任务|task|action|行动项)[:：](.+)', re.IGNORECASE),
+            r'(.+?)(负责|will\s+do|needs?\s+to|should|要|需要)(.+)',
+            # Task descriptions (punctuation pre-normalized to ASCII ':')
+            r'(任务|task|action|行动项):(.+)',
             # Follow-up items
-            re.compile(r'(跟进|follow.?up|next\s+step|下一步)[:：]?(.+)', re.IGNORECASE),
+            r'(跟进|follow.?up|next\s+step|下一步):?(.+)',
             # Assignments with names
-            re.compile(r'(@\w+|[A-Za-z\u4e00-\u9fa5]+)\s+(负责|will|needs?\s+to|要)(.+)', re.IGNORECASE),
+            r'(@\w+|[A-Za-z一-龥]+)\s+(负责|will|needs?\s+to|要)(.+)',
             # Todo items
-            re.compile(r'(todo|待办|需要做的?)[:：](.+)', re.IGNORECASE),
+            r'(todo|待办|需要做的?):(.+)',
             # Deadline patterns
-            re.compile(r'(.+?)(在|by|before|until|截止|deadline)(.+?)(完成|finish|done)', re.IGNORECASE),
+            r'(.+?)(在|by|before|until|截止|deadline)(.+?)(完成|finish|done)',
         ]
-        return patterns
+        master = _compile(
+            "|".join(f"(?P<p{i}>{pat})" for i, pat in enumerate(raw_patterns)),
+            ignorecase=True,
+        )
+
+        # Each alternative owns the inner group indices between its own named
+        # group and the next one; its handler extracts the action text from
+        # exactly those groups.
+        outer_indices = [master.groupindex[f"p{i}"] for i in range(len(raw_patterns))]
+        outer_indices.append(master.groups + 1)
+        handlers = {
+            f"p{i}": ActionExtractor._make_action_text_handler(outer_indices[i] + 1, outer_indices[i + 1])
+            for i in range(len(raw_patterns))
+        }
+        return master, handlers
+
+    @staticmethod
+    def _make_action_text_handler(start: int, end: int) -> Callable[[re.Match], Optional[Tuple[int, int]]]:
+        """Build a handler that picks the action-text span from one alternative's groups."""
+
+        def handler(match: re.Match) -> Optional[Tuple[int, int]]:
+            for idx in range(start, end):
+                group = match.group(idx)
+                if group and len(group.strip()) > 3:  # Valid action text
+                    if not any(keyword in group.lower() for keyword in ["负责", "will", "needs", "should", "要", "需要"]):
+                        return match.span(idx)
+            return None
+
+        return handler
 
-    def _compile_time_patterns(self) -> List[Tuple[re.Pattern, int]]:
-        """Compile patterns for deadline extraction."""
-        patterns = [
+    @staticmethod
+    @functools.cache
+    def _compile_time_patterns() -> Tuple[re.Pattern, Dict[str, Callable]]:
+        """Compile deadline patterns into one alternation regex with named groups.
+
+        One scan over the text replaces ten sequential searches, and the
+        specific-date alternatives now resolve to real calendar dates instead
+        of falling through to "today". Cached once per process.
+        """
+
+        def fixed(days: int) -> Callable:
+            def handler(match: re.Match, base: datetime) -> Optional[datetime]:
+                return base + timedelta(days=days)
+            return handler
+
+        def month_day(match: re.Match, base: datetime) -> Optional[datetime]:
+            try:
+                deadline = datetime(base.year, int(match.group("md_mon")), int(match.group("md_day")))
+            except ValueError:
+                return None
+            if deadline < base:
+                # Already past this year; assume the date refers to next year.
+                deadline = deadline.replace(year=base.year + 1)
+            return deadline
+
+        def full_date(match: re.Match, base: datetime) -> Optional[datetime]:
+            try:
+                return datetime(int(match.group("fd_year")), int(match.group("fd_mon")), int(match.group("fd_day")))
+            except ValueError:
+                return None
+
+        def variable(unit_days: int, cn_group: str, en_group: str) -> Callable:
+            def handler(match: re.Match, base: datetime) -> Optional[datetime]:
+                value = match.group(cn_group) or match.group(en_group)
+                try:
+                    return base + timedelta(days=int(value) * unit_days)
+                except (TypeError, ValueError):
+                    return None
+            return handler
+
+        specs = [
             # Specific dates
-            (re.compile(r'(\d{1,2})[月/\-](\d{1,2})[日号]?'), 0),
-            (re.compile(r'(\d{4})[年\-/](\d{1,2})[月\-/](\d{1,2})[日]?'), 0),
+            (r'(?P<md_mon>\d{1,2})[月/\-](?P<md_day>\d{1,2})[日号]?', month_day),
+            (r'(?P<fd_year>\d{4})[年\-/](?P<fd_mon>\d{1,2})[月\-/](?P<fd_day>\d{1,2})[日]?', full_date),
             # Relative time
-            (re.compile(r'明天|tomorrow'), 1),
-            (re.compile(r'后天|day\s+after\s+tomorrow'), 2),
-            (re.compile(r'下周|next\s+week'), 7),
-            (re.compile(r'下个?月|next\s+month'), 30),
-            (re.compile(r'(\d+)\s*天[后内]?|in\s+(\d+)\s+days?'), None),  # Variable days
-            (re.compile(r'(\d+)\s*周[后内]?|in\s+(\d+)\s+weeks?'), None),  # Variable weeks
-            (re.compile(r'这周[内末]?|this\s+week'), 7),
-            (re.compile(r'本月[内末]?|this\s+month'), 30),
+            (r'明天|tomorrow', fixed(1)),
+            (r'后天|day\s+after\s+tomorrow', fixed(2)),
+            (r'下周|next\s+week', fixed(7)),
+            (r'下个?月|next\s+month', fixed(30)),
+            (r'(?P<vd_cn>\d+)\s*天[后内]?|in\s+(?P<vd_en>\d+)\s+days?', variable(1, "vd_cn", "vd_en")),
+            (r'(?P<vw_cn>\d+)\s*周[后内]?|in\s+(?P<vw_en>\d+)\s+weeks?', variable(7, "vw_cn", "vw_en")),
+            (r'这周[内末]?|this\s+week', fixed(7)),
+            (r'本月[内末]?|this\s+month', fixed(30)),
         ]
-        return patterns
+        master = _compile("|".join(f"(?P<t{i}>{src})" for i, (src, _) in enumerate(specs)))
+        handlers = {f"t{i}": handler for i, (_, handler) in enumerate(specs)}
+        return master, handlers
 
     async def extract_action_items(self, text: str, meeting_id: str, speaker_id: Optional[str] = None) -> List[ActionItemEvent]:
         """Extract action items from meeting text."""
         try:
             action_events = []
 
+            # Normalize full-width punctuation once; the pattern, deadline and
+            # priority scanners all assume ASCII variants. Only the scanners
+            # see the normalized copy — stored and emitted text stays original.
+            norm_text = text.translate(_NORMALIZE)
+
             # First, try pattern-based extraction
-            pattern_actions = self._extract_with_patterns(text, meeting_id, speaker_id)
+            pattern_actions = self._extract_with_patterns(norm_text, meeting_id, speaker_id, source_text=text)
             action_events.extend(pattern_actions)
 
             # Then, try LLM-based extraction for more complex cases
             llm_actions = await self._extract_with_llm(text, meeting_id, speaker_id)
             action_events.extend(llm_actions)
 
-            # Store extracted actions
-            if meeting_id not in self.action_items:
-                self.action_items[meeting_id] = []
+            # Store extracted actions. The stats entry is seeded alongside
+            # the list so an extraction that yields nothing still leaves the
+            # zero-count shape behind for get_action_stats.
+            items = self.action_items.setdefault(meeting_id, [])
+            stats = self._stats.setdefault(meeting_id, {
+                "total": 0,
+                "pending": 0,
+                "completed": 0,
+                "high_priority": 0,
+                "with_assignee": 0,
+                "with_deadline": 0,
+            })
 
+            now = datetime.now()
             for event in action_events:
                 action_item = ActionItem(
-                    id=str(uuid.uuid4()),
+                    id=f"{_ID_PREFIX}-{next(_id_counter):08x}",
                     action=event.action,
                     assignee=event.assignee,
                     deadline=event.deadline,
                     priority=event.priority,
                     status="pending",
-                    created_at=datetime.now(),
+                    created_at=now,
                     meeting_id=meeting_id,
                     source_text=text
                 )
-                self.action_items[meeting_id].append(action_item)
+                items.append(action_item)
+                self._action_index.setdefault(meeting_id, {})[action_item.id] = action_item
+
+                stats["total"] += 1
+                stats["pending"] += 1
+                if action_item.priority == "high":
+                    stats["high_priority"] += 1
+                if action_item.assignee:
+                    stats["with_assignee"] += 1
+                if action_item.deadline:
+                    stats["with_deadline"] += 1
+                    bisect.insort(
+                        self._pending_deadlines.setdefault(meeting_id, []),
+                        (action_item.deadline, action_item.id),
+                    )
+                    bisect.insort(
+                        self._by_deadline.setdefault(meeting_id, []),
+                        action_item,
+                        key=_DEADLINE_KEY,
+                    )
 
             return action_events
 
@@ -95,65 +325,130 @@ class ActionExtractor:
             self.ten_env.log_error(f"Failed to extract action items: {e}")
             return []
 
-    def _extract_with_patterns(self, text: str, meeting_id: str, speaker_id: Optional[str] = None) -> List[ActionItemEvent]:
-        """Extract action items using regex patterns."""
+    def _extract_with_patterns(self, text: str, meeting_id: str, speaker_id: Optional[str] = None, source_text: Optional[str] = None) -> List[ActionItemEvent]:
+        """Extract action items using regex patterns.
+
+        `text` is the (possibly normalized) copy the scanners run over;
+        `source_text` is what gets emitted. _NORMALIZE maps characters 1:1,
+        so match spans on the scanned copy line up with the original.
+        """
         actions = []
+        source = source_text if source_text is not None else text
 
         try:
-            for pattern in self.action_patterns:
-                matches = pattern.finditer(text)
-
-                for match in matches:
-                    groups = match.groups()
-
-                    # Extract action description
-                    action_text = ""
-                    assignee = None
-
-                    if len(groups) >= 2:
-                        # Try to identify the action part
-                        for group in groups:
-                            if group and len(group.strip()) > 3:  # Valid action text
-                                if not any(keyword in group.lower() for keyword in ["负责", "will", "needs", "should", "要", "需要"]):
-                                    action_text = group.strip()
-                                    break
-
-                    if not action_text:
-                        continue
-
-                    # Extract assignee
+            # Assignee, deadline and priority all depend on the full text only,
+            # so compute them once per call instead of once per match.
+            assignee = None
+            deadline = None
+            priority = "medium"
+            helpers_done = False
+
+            for match in self._master_pattern.finditer(text):
+                # Extract action description from the original via the span
+                span = self._handlers[match.lastgroup](match)
+
+                if span is None:
+                    continue
+                action_text = source[span[0]:span[1]].strip()
+
+                if not helpers_done:
                     assignee = self._extract_assignee(text, speaker_id)
-
-                    # Extract deadline
                     deadline = self._extract_deadline(text)
-
-                    # Determine priority
                     priority = self._determine_priority(text)
+                    helpers_done = True
 
-                    action_event = ActionItemEvent(
-                        action=action_text,
-                        assignee=assignee,
-                        deadline=deadline,
-                        priority=priority,
-                        meeting_id=meeting_id,
-                        source_text=text
-                    )
+                action_event = ActionItemEvent(
+                    action=action_text,
+                    assignee=assignee,
+                    deadline=deadline,
+                    priority=priority,
+                    meeting_id=meeting_id,
+                    source_text=source
+                )
 
-                    actions.append(action_event)
+                actions.append(action_event)
 
         except Exception as e:
             self.ten_env.log_error(f"Pattern extraction failed: {e}")
 
         return actions
 
+    # LLM batching: at most this many turns per call, and at most this long
+    # (seconds) waiting for more turns to coalesce.
+    _LLM_BATCH_SIZE = 8
+    _LLM_BATCH_WINDOW = 0.05
+
     async def _extract_with_llm(self, text: str, meeting_id: str, speaker_id: Optional[str] = None) -> List[ActionItemEvent]:
-        """Extract action items using LLM."""
+        """Extract action items using LLM.
+
+        Concurrent calls are coalesced by a background batcher into one LLM
+        request, amortizing per-request overhead across transcript turns.
+        """
         try:
-            prompt = f"""
-请从以下会议对话中提取具体的行动项或任务：
+            if self._llm_batch_queue is None:
+                self._llm_batch_queue = asyncio.Queue()
+                self._llm_batch_task = asyncio.create_task(self._llm_batch_loop())
 
-对话内容：
-{text}
+            future = asyncio.get_running_loop().create_future()
+            self._llm_batch_queue.put_nowait((text, meeting_id, speaker_id, future))
+            return await future
+
+        except Exception as e:
+            self.ten_env.log_error(f"LLM extraction failed: {e}")
+            return []
+
+    async def _llm_batch_loop(self) -> None:
+        """Drain queued extraction requests and serve each batch with one LLM call."""
+        while True:
+            batch = [await self._llm_batch_queue.get()]
+            loop = asyncio.get_running_loop()
+            deadline = loop.time() + self._LLM_BATCH_WINDOW
+            while len(batch) < self._LLM_BATCH_SIZE:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._llm_batch_queue.get(), remaining))
+                except asyncio.TimeoutError:
+                    break
+
+            try:
+                results = await self._run_llm_batch(batch)
+            except Exception as e:
+                self.ten_env.log_error(f"Batched LLM extraction failed: {e}")
+                results = [[] for _ in batch]
+
+            for (_, _, _, future), result in zip(batch, results):
+                if not future.done():
+                    future.set_result(result)
+
+    async def close(self) -> None:
+        """Cancel the background batcher; queued requests resolve empty."""
+        task = self._llm_batch_task
+        self._llm_batch_task = None
+        if task is not None:
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+        if self._llm_batch_queue is not None:
+            while not self._llm_batch_queue.empty():
+                _, _, _, future = self._llm_batch_queue.get_nowait()
+                if not future.done():
+                    future.set_result([])
+            self._llm_batch_queue = None
+
+    async def _run_llm_batch(self, batch: List[Tuple]) -> List[List[ActionItemEvent]]:
+        """Build one prompt covering every turn in the batch and run it."""
+        turns = "\n\n".join(
+            f"【片段{i}】\n{text}"
+            for i, (text, _, _, _) in enumerate(batch, 1)
+        )
+        prompt = f"""
+请从以下会议对话片段中分别提取具体的行动项或任务：
+
+{turns}
 
 请识别：
 1. 具体的行动项或任务
@@ -163,30 +458,40 @@ class ActionExtractor:
 
 要求：
 - 只提取明确的行动项，不要推测
-- 如果没有明确的行动项，请返回"无"
-- 格式：[行动项] | [负责人] | [截止时间] | [优先级]
+- 如果某个片段没有明确的行动项，请对该片段返回"无"
+- 格式：【片段N】[行动项] | [负责人] | [截止时间] | [优先级]
 
 行动项："""
 
-            # This is a simplified version - in practice, you'd implement proper LLM interaction
-            # For now, return empty list
-            return []
-
-        except Exception as e:
-            self.ten_env.log_error(f"LLM extraction failed: {e}")
-            return []
+        # This is a simplified version - in practice, you'd implement proper LLM
+        # interaction and split the numbered response back out per segment
+        # For now, return empty lists
+        return [[] for _ in batch]
+
+    # Pure-ASCII fast path for the dominant @username mention form, compiled
+    # as a bytes pattern: _sre walks 1-byte lanes over the utf-8 buffer
+    # instead of UCS-4 codepoints. CJK mentions fall through to the str
+    # patterns below, which include the unicode-aware @\w+ variant.
+    _NAME_PATTERN_ASCII = re.compile(rb'(@[A-Za-z0-9_]+)')
+
+    # Explicit name-mention patterns, compiled once at class definition instead
+    # of on every _extract_assignee call.
+    _NAME_PATTERNS: Tuple[re.Pattern, ...] = (
+        _compile(r'(@\w+)'),  # @username
+        _compile(r'([A-Za-z一-龥]{2,})\s*负责'),  # Name + 负责
+        _compile(r'([A-Za-z一-龥]{2,})\s*will\s+do', ignorecase=True),
+        _compile(r'([A-Za-z一-龥]{2,})\s*needs?\s+to', ignorecase=True),
+    )
 
     def _extract_assignee(self, text: str, default_speaker: Optional[str] = None) -> Optional[str]:
         """Extract assignee from text."""
-        # Look for explicit name mentions
-        name_patterns = [
-            re.compile(r'(@\w+)'),  # @username
-            re.compile(r'([A-Za-z\u4e00-\u9fa5]{2,})\s*负责'),  # Name + 负责
-            re.compile(r'([A-Za-z\u4e00-\u9fa5]{2,})\s*will\s+do', re.IGNORECASE),
-            re.compile(r'([A-Za-z\u4e00-\u9fa5]{2,})\s*needs?\s+to', re.IGNORECASE),
-        ]
+        # Fast path: ASCII @username over the utf-8 bytes of the text.
+        match = self._NAME_PATTERN_ASCII.search(text.encode("utf-8"))
+        if match:
+            return match.group(1).decode("ascii").replace('@', '')
 
-        for pattern in name_patterns:
+        # Look for explicit name mentions
+        for pattern in self._NAME_PATTERNS:
             match = pattern.search(text)
             if match:
                 return match.group(1).replace('@', '')
@@ -196,42 +501,34 @@ class ActionExtractor:
 
     def _extract_deadline(self, text: str) -> Optional[datetime]:
         """Extract deadline from text."""
-        for pattern, days_offset in self.time_patterns:
-            match = pattern.search(text)
-            if match:
-                if days_offset is not None:
-                    return datetime.now() + timedelta(days=days_offset)
-                else:
-                    # Variable time patterns
-                    groups = match.groups()
-                    if groups and groups[0]:
-                        try:
-                            days = int(groups[0])
-                            if "周" in match.group() or "week" in match.group():
-                                days *= 7
-                            return datetime.now() + timedelta(days=days)
-                        except (ValueError, IndexError):
-                            continue
-
-        return None
+        match = self._time_master.search(text)
+        if not match:
+            return None
+        return self._time_handlers[match.lastgroup](match, datetime.now())
 
     def _determine_priority(self, text: str) -> str:
         """Determine action item priority from text."""
-        text_lower = text.lower()
-
-        for priority, keywords in self.priority_keywords.items():
-            if any(keyword in text_lower for keyword in keywords):
+        if self._priority_acs is not None:
+            # The first keyword hit decides the priority. CJK keywords are
+            # checked against the raw text first; the lowered copy is only
+            # allocated if the ASCII automaton actually has to run.
+            cjk_automaton, ascii_automaton = self._priority_acs
+            for _, priority in cjk_automaton.iter(text):
                 return priority
+            for _, priority in ascii_automaton.iter(text.lower()):
+                return priority
+            return "medium"
 
-        return "medium"  # Default priority
+        match = self._prio_regex.search(text)
+        return self._prio_group_to_prio[match.lastgroup] if match else "medium"
 
     async def categorize_actions(self, meeting_id: str) -> Dict[str, List[ActionItem]]:
         """Categorize action items by type, priority, or assignee."""
         try:
-            if meeting_id not in self.action_items:
+            actions = self.action_items.get(meeting_id)
+            if actions is None:
                 return {}
 
-            actions = self.action_items[meeting_id]
             categorized = {
                 "by_priority": {"high": [], "medium": [], "low": []},
                 "by_assignee": {},
@@ -252,19 +549,20 @@ class ActionExtractor:
                     categorized["by_assignee"][assignee] = []
                 categorized["by_assignee"][assignee].append(action)
 
-                # By deadline
-                if action.deadline:
-                    if action.deadline < now:
-                        categorized["by_deadline"]["overdue"].append(action)
-                    elif action.deadline <= week_from_now:
-                        categorized["by_deadline"]["this_week"].append(action)
-                    elif action.deadline <= two_weeks_from_now:
-                        categorized["by_deadline"]["next_week"].append(action)
-                    else:
-                        categorized["by_deadline"]["later"].append(action)
-                else:
+                if not action.deadline:
                     categorized["by_deadline"]["no_deadline"].append(action)
 
+            # Deadline buckets are contiguous slices of the sorted list, found
+            # with three bisects instead of per-action datetime comparisons.
+            ordered = self._by_deadline.get(meeting_id, [])
+            overdue_end = bisect.bisect_left(ordered, now, key=_DEADLINE_KEY)
+            week_end = bisect.bisect_right(ordered, week_from_now, key=_DEADLINE_KEY)
+            two_weeks_end = bisect.bisect_right(ordered, two_weeks_from_now, key=_DEADLINE_KEY)
+            categorized["by_deadline"]["overdue"] = ordered[:overdue_end]
+            categorized["by_deadline"]["this_week"] = ordered[overdue_end:week_end]
+            categorized["by_deadline"]["next_week"] = ordered[week_end:two_weeks_end]
+            categorized["by_deadline"]["later"] = ordered[two_weeks_end:]
+
             return categorized
 
         except Exception as e:
@@ -274,18 +572,39 @@ class ActionExtractor:
     async def update_action_status(self, meeting_id: str, action_id: str, status: str) -> bool:
         """Update the status of an action item."""
         try:
-            if meeting_id in self.action_items:
-                for action in self.action_items[meeting_id]:
-                    if action.id == action_id:
-                        action.status = status
-                        self.ten_env.log_info(f"Updated action {action_id} status to {status}")
-                        return True
+            action = self._action_index.get(meeting_id, {}).get(action_id)
+            if action:
+                old_status = action.status
+                action.status = status
+                if old_status != status:
+                    self._apply_status_transition(meeting_id, action, old_status, status)
+                self.ten_env.log_info(f"Updated action {action_id} status to {status}")
+                return True
             return False
 
         except Exception as e:
             self.ten_env.log_error(f"Failed to update action status: {e}")
             return False
 
+    def _apply_status_transition(self, meeting_id: str, action: ActionItem, old_status: str, new_status: str) -> None:
+        """Keep the running counters and pending-deadline list in sync."""
+        stats = self._stats.get(meeting_id)
+        if stats is not None:
+            if old_status in ("pending", "completed"):
+                stats[old_status] -= 1
+            if new_status in ("pending", "completed"):
+                stats[new_status] += 1
+
+        if action.deadline:
+            entry = (action.deadline, action.id)
+            pending = self._pending_deadlines.get(meeting_id, [])
+            if old_status == "pending" and new_status != "pending":
+                index = bisect.bisect_left(pending, entry)
+                if index < len(pending) and pending[index] == entry:
+                    del pending[index]
+            elif old_status != "pending" and new_status == "pending":
+                bisect.insort(pending, entry)
+
     def get_action_items(self, meeting_id: str) -> List[ActionItem]:
         """Get all action items for a meeting."""
         return self.action_items.get(meeting_id, [])
@@ -297,63 +616,70 @@ class ActionExtractor:
 
     def get_overdue_actions(self, meeting_id: str) -> List[ActionItem]:
         """Get overdue action items for a meeting."""
-        actions = self.action_items.get(meeting_id, [])
-        now = datetime.now()
-        return [
-            action for action in actions
-            if action.deadline and action.deadline < now and action.status == "pending"
-        ]
+        ordered = self._by_deadline.get(meeting_id, [])
+        cutoff = bisect.bisect_left(ordered, datetime.now(), key=_DEADLINE_KEY)
+        return [action for action in ordered[:cutoff] if action.status == "pending"]
 
     async def export_action_items(self, meeting_id: str, format: str = "markdown") -> Optional[str]:
         """Export action items in specified format."""
         try:
-            if meeting_id not in self.action_items:
+            actions = self.action_items.get(meeting_id)
+            if actions is None:
                 return None
 
-            actions = self.action_items[meeting_id]
-
             if format == "markdown":
-                lines = [f"# 行动项清单 - {meeting_id}", ""]
+                # Single-pass StringIO build; no intermediate lines list
+                # followed by a second O(total_chars) join pass.
+                buf = io.StringIO()
+                write = buf.write
+                write(f"# 行动项清单 - {meeting_id}\n\n")
 
-                # Group by status
-                statuses = {}
+                statuses = defaultdict(list)
                 for action in actions:
-                    if action.status not in statuses:
-                        statuses[action.status] = []
                     statuses[action.status].append(action)
 
                 for status, action_list in statuses.items():
-                    lines.append(f"## {status.upper()}")
-                    lines.append("")
+                    write(f"## {status.upper()}\n\n")
 
+                    checkbox = "- [x]" if status == "completed" else "- [ ]"
                     for action in action_list:
-                        checkbox = "- [x]" if status == "completed" else "- [ ]"
                         assignee_str = f" (@{action.assignee})" if action.assignee else ""
                         deadline_str = f" (截止: {action.deadline.strftime('%Y-%m-%d')})" if action.deadline else ""
                         priority_str = f" [{action.priority.upper()}]"
 
-                        lines.append(f"{checkbox} {action.action}{assignee_str}{deadline_str}{priority_str}")
+                        write(f"{checkbox} {action.action}{assignee_str}{deadline_str}{priority_str}\n")
 
-                    lines.append("")
+                    write("\n")
 
-                return "\n".join(lines)
+                # Drop the final blank separator line, matching the old
+                # "\n".join output exactly.
+                return buf.getvalue()[:-1]
 
             elif format == "json":
-                import json
                 actions_dict = [
                     {
                         "id": action.id,
                         "action": action.action,
                         "assignee": action.assignee,
-                        "deadline": action.deadline.isoformat() if action.deadline else None,
+                        "deadline": action.deadline,
                         "priority": action.priority,
                         "status": action.status,
-                        "created_at": action.created_at.isoformat(),
+                        "created_at": action.created_at,
                         "meeting_id": action.meeting_id
                     }
                     for action in actions
                 ]
-                return json.dumps(actions_dict, ensure_ascii=False, indent=2)
+                if orjson is not None:
+                    # orjson renders datetimes as ISO-8601 in C, so no
+                    # per-field .isoformat() strings are allocated here.
+                    return orjson.dumps(actions_dict, option=orjson.OPT_INDENT_2).decode()
+                import json
+                return json.dumps(
+                    actions_dict,
+                    ensure_ascii=False,
+                    indent=2,
+                    default=lambda value: value.isoformat(),
+                )
 
             return None
 
@@ -363,19 +689,21 @@ class ActionExtractor:
 
     def get_action_stats(self, meeting_id: str) -> Dict:
         """Get statistics about action items."""
-        if meeting_id not in self.action_items:
+        stats = self._stats.get(meeting_id)
+        if stats is None:
             return {"status": "no_actions"}
 
-        actions = self.action_items[meeting_id]
-
-        stats = {
-            "total": len(actions),
-            "pending": len([a for a in actions if a.status == "pending"]),
-            "completed": len([a for a in actions if a.status == "completed"]),
-            "overdue": len([a for a in actions if a.deadline and a.deadline < datetime.now() and a.status == "pending"]),
-            "high_priority": len([a for a in actions if a.priority == "high"]),
-            "with_assignee": len([a for a in actions if a.assignee]),
-            "with_deadline": len([a for a in actions if a.deadline])
-        }
-
-        return stats
\ No newline at end of file
+        # Overdue depends on the current time: binary-search the cutoff in the
+        # deadline-sorted pending list instead of rescanning all actions.
+        pending_deadlines = self._pending_deadlines.get(meeting_id, [])
+        overdue = bisect.bisect_left(pending_deadlines, (datetime.now(),))
+
+        return {
+            "total": stats["total"],
+            "pending": stats["pending"],
+            "completed": stats["completed"],
+            "overdue": overdue,
+            "high_priority": stats["high_priority"],
+            "with_assignee": stats["with_assignee"],
+            "with_deadline": stats["with_deadline"],
+        }
\ No newline at end of file
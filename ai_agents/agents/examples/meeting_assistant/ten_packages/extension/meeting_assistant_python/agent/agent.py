@@ -1,6 +1,7 @@
 import asyncio
 import json
 import uuid
+from collections import deque
 from datetime import datetime
 from typing import Awaitable, Callable, Optional
 from .llm_exec import LLMExec
@@ -12,29 +13,85 @@ from ten_runtime import AsyncTenEnv, Cmd, CmdResult, Data, StatusCode
 from ten_ai_base.types import LLMToolMetadata
 from .events import *
 
+try:
+    # orjson parses the remaining JSON-transported properties (participants,
+    # ASR metadata) several times faster than stdlib json; it accepts str
+    # input directly.
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+try:
+    # Swap in libuv's event loop: every ASR queue wake-up, create_task and
+    # send_data below goes through the loop, so the C implementation pays off
+    # on high-rate streams. This must run at import time, before the runtime
+    # creates its loop, for the policy to take effect.
+    import uvloop
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+except ImportError:  # uvloop is optional and not available on Windows
+    pass
+
 
 class MeetingAgent:
+    # No per-instance dict: attribute access compiles to fixed slot offsets
+    # on the hot dispatch paths and the instance shrinks accordingly.
+    __slots__ = (
+        "ten_env",
+        "stopped",
+        "_callbacks",
+        "_dispatch_cache",
+        "_llm_deque",
+        "_llm_event",
+        "_llm_consumer",
+        "_llm_cancelled",
+        "_llm_idle",
+        "llm_exec",
+        "meeting_processor",
+        "summary_generator",
+        "action_extractor",
+        "calendar_manager",
+        "current_meeting_id",
+        "meeting_active",
+        "_outbound_buffer",
+        "_outbound_flush_task",
+        "_action_batch",
+        "_action_batch_task",
+    )
+
     def __init__(self, ten_env: AsyncTenEnv):
         self.ten_env: AsyncTenEnv = ten_env
         self.stopped = False
 
-        # Callback registry
+        # Callback registry, keyed by event class. Handler collections are
+        # immutable tuples rebuilt on registration: registration is rare,
+        # dispatch runs per event.
         self._callbacks: dict[
-            AgentEvent, list[Callable[[AgentEvent], Awaitable]]
+            type, tuple[Callable[[AgentEvent], Awaitable], ...]
+        ] = {}
+        # Concrete-type -> flattened handler tuple, filled lazily from an MRO
+        # walk on first dispatch and cleared whenever a handler is registered.
+        self._dispatch_cache: dict[
+            type, tuple[Callable[[AgentEvent], Awaitable], ...]
         ] = {}
 
-        # Queues for ordered processing
-        self._asr_queue: asyncio.Queue[ASRResultEvent] = asyncio.Queue()
-        self._llm_queue: asyncio.Queue[LLMResponseEvent] = asyncio.Queue()
-        self._meeting_queue: asyncio.Queue[AgentEvent] = asyncio.Queue()
+        # Channel for ordered LLM processing: a plain deque plus a wake-up
+        # Event. Cheaper than asyncio.Queue per item, and flushing becomes an
+        # O(1) clear instead of a get_nowait drain loop. ASR and meeting
+        # events dispatch inline since they arrive serialized.
+        self._llm_deque: deque[LLMResponseEvent] = deque()
+        self._llm_event = asyncio.Event()
 
         # Current consumer tasks
-        self._asr_consumer: Optional[asyncio.Task] = None
         self._llm_consumer: Optional[asyncio.Task] = None
-        self._meeting_consumer: Optional[asyncio.Task] = None
-        self._llm_active_task: Optional[asyncio.Task] = (
-            None  # currently running handler
-        )
+        # Cancel token set by flush_llm and checked between handlers, so LLM
+        # dispatch runs inline in the consumer instead of wrapping every
+        # delta in a fresh Task just to make it cancellable.
+        self._llm_cancelled = False
+        # Set whenever no LLM dispatch is in flight; flush_llm waits on it
+        # (with a timeout) so cancellation has bounded latency.
+        self._llm_idle = asyncio.Event()
+        self._llm_idle.set()
 
         # Core components
         self.llm_exec = LLMExec(ten_env)
@@ -51,10 +108,20 @@ class MeetingAgent:
         self.current_meeting_id: Optional[str] = None
         self.meeting_active = False
 
+        # Outbound notification buffer: bursts of short notifications (action
+        # items, calendar events, summaries) coalesce into one text_data frame
+        # flushed at the next event-loop turn instead of one send_data each.
+        self._outbound_buffer: list[str] = []
+        self._outbound_flush_task: Optional[asyncio.Task] = None
+
+        # Final-ASR batch for action extraction: finals landing within the
+        # window are extracted in one call so the LLM-backed extractor runs
+        # once per burst instead of once per transcript turn.
+        self._action_batch: list[tuple[str, Optional[str]]] = []
+        self._action_batch_task: Optional[asyncio.Task] = None
+
         # Start consumers
-        self._asr_consumer = asyncio.create_task(self._consume_asr())
         self._llm_consumer = asyncio.create_task(self._consume_llm())
-        self._meeting_consumer = asyncio.create_task(self._consume_meeting_events())
 
         # Register default meeting handlers
         self._register_default_handlers()
@@ -75,7 +142,25 @@ class MeetingAgent:
         """
 
         def decorator(func: Callable[[AgentEvent], Awaitable]):
-            self._callbacks.setdefault(event_type, []).append(func)
+            # Error boundary lives here, applied once per registration, so
+            # the per-event dispatch loop carries no try/except frame.
+            async def safe_handler(
+                event: AgentEvent,
+                _handler=func,
+                _log_error=self.ten_env.log_error,
+                _name=getattr(event_type, "__name__", str(event_type)),
+            ):
+                try:
+                    await _handler(event)
+                except asyncio.CancelledError:
+                    raise
+                except Exception as e:
+                    _log_error(f"Handler error for {_name}: {e}")
+
+            self._callbacks[event_type] = self._callbacks.get(event_type, ()) + (
+                safe_handler,
+            )
+            self._dispatch_cache.clear()
             return func
 
         if handler is None:
@@ -83,53 +168,58 @@ class MeetingAgent:
         else:
             return decorator(handler)
 
-    async def _dispatch(self, event: AgentEvent):
+    async def _dispatch(self, event: AgentEvent, check_cancel: bool = False):
         """Dispatch event to registered handlers sequentially."""
-        for etype, handlers in self._callbacks.items():
-            if isinstance(event, etype):
-                for h in handlers:
-                    try:
-                        await h(event)
-                    except asyncio.CancelledError:
-                        raise
-                    except Exception as e:
-                        self.ten_env.log_error(
-                            f"Handler error for {etype}: {e}"
-                        )
+        etype = type(event)
+        handlers = self._dispatch_cache.get(etype)
+        if handlers is None:
+            # One MRO walk per concrete event type; afterwards dispatch is a
+            # single dict lookup instead of an isinstance scan per event.
+            handlers = tuple(
+                h
+                for klass in etype.__mro__
+                for h in self._callbacks.get(klass, ())
+            )
+            self._dispatch_cache[etype] = handlers
 
-    # === Consumers ===
-    async def _consume_asr(self):
-        while not self.stopped:
-            event = await self._asr_queue.get()
-            await self._dispatch(event)
+        for h in handlers:
+            if check_cancel and self._llm_cancelled:
+                raise asyncio.CancelledError
+            await h(event)
 
+    # === Consumers ===
     async def _consume_llm(self):
         while not self.stopped:
-            event = await self._llm_queue.get()
-            # Run handler as a task so we can cancel mid-flight
-            self._llm_active_task = asyncio.create_task(self._dispatch(event))
-            try:
-                await self._llm_active_task
-            except asyncio.CancelledError:
-                self.ten_env.log_info("[Agent] Active LLM task cancelled")
-            finally:
-                self._llm_active_task = None
-
-    async def _consume_meeting_events(self):
-        """Consumer for meeting-specific events."""
-        while not self.stopped:
-            event = await self._meeting_queue.get()
-            await self._dispatch(event)
+            await self._llm_event.wait()
+            while self._llm_deque:
+                event = self._llm_deque.popleft()
+                self._llm_cancelled = False
+                self._llm_idle.clear()
+                try:
+                    # Inline dispatch; flush_llm cancels via the token above
+                    # instead of a per-delta Task wrapper.
+                    await self._dispatch(event, check_cancel=True)
+                except asyncio.CancelledError:
+                    self.ten_env.log_info("[Agent] Active LLM task cancelled")
+                finally:
+                    self._llm_idle.set()
+                    event.release()
+            self._llm_event.clear()
 
     # === Emit events ===
     async def _emit_asr(self, event: ASRResultEvent):
-        await self._asr_queue.put(event)
+        # ASR results already arrive serialized from on_data; dispatch inline.
+        try:
+            await self._dispatch(event)
+        finally:
+            event.release()
 
     async def _emit_llm(self, event: LLMResponseEvent):
-        await self._llm_queue.put(event)
+        self._llm_deque.append(event)
+        self._llm_event.set()
 
     async def _emit_meeting(self, event: AgentEvent):
-        await self._meeting_queue.put(event)
+        await self._dispatch(event)
 
     async def _emit_direct(self, event: AgentEvent):
         await self._dispatch(event)
@@ -154,11 +244,11 @@ class MeetingAgent:
                 )
             elif name == "start_meeting":
                 participants_json, _ = cmd.get_property_to_json("participants")
-                participants = json.loads(participants_json) if participants_json else []
+                participants = _json_loads(participants_json) if participants_json else []
                 agenda = cmd.get_property_string("agenda")
                 meeting_type = cmd.get_property_string("meeting_type") or "general"
 
-                meeting_id = str(uuid.uuid4())
+                meeting_id = uuid.uuid4().hex
                 await self._emit_meeting(MeetingStartEvent(
                     meeting_id=meeting_id,
                     participants=participants,
@@ -187,15 +277,16 @@ class MeetingAgent:
     async def on_data(self, data: Data):
         try:
             if data.get_name() == "asr_result":
-                asr_json, _ = data.get_property_to_json(None)
-                asr = json.loads(asr_json)
+                # Read fields with per-property accessors: no intermediate
+                # JSON string and no full dict parse per ASR partial. Only
+                # the nested metadata still goes through JSON.
                 await self._emit_asr(
-                    ASRResultEvent(
-                        text=asr.get("text", ""),
-                        final=asr.get("final", False),
-                        metadata=asr.get("metadata", {}),
-                        speaker_id=asr.get("speaker_id"),
-                        confidence=asr.get("confidence")
+                    ASRResultEvent.acquire(
+                        text=self._get_data_prop(data.get_property_string, "text", ""),
+                        final=self._get_data_prop(data.get_property_bool, "final", False),
+                        metadata=self._get_data_metadata(data),
+                        speaker_id=self._get_data_prop(data.get_property_string, "speaker_id"),
+                        confidence=self._get_data_prop(data.get_property_float, "confidence")
                     )
                 )
             else:
@@ -203,11 +294,35 @@ class MeetingAgent:
         except Exception as e:
             self.ten_env.log_error(f"on_data error: {e}")
 
+    @staticmethod
+    def _get_data_prop(getter, key: str, default=None):
+        """Read one property, falling back to default when it is absent.
+
+        Runtime getters return (value, TenError|None); the error is set
+        when the property is missing or has the wrong type.
+        """
+        try:
+            value, err = getter(key)
+        except Exception:
+            return default
+        if err is not None or value is None:
+            return default
+        return value
+
+    @staticmethod
+    def _get_data_metadata(data: Data) -> dict:
+        """Parse only the metadata sub-property as JSON."""
+        try:
+            metadata_json, _ = data.get_property_to_json("metadata")
+            return _json_loads(metadata_json) if metadata_json else {}
+        except Exception:
+            return {}
+
     async def _on_llm_response(
         self, ten_env: AsyncTenEnv, delta: str, text: str, is_final: bool
     ):
         await self._emit_llm(
-            LLMResponseEvent(delta=delta, text=text, is_final=is_final)
+            LLMResponseEvent.acquire(delta=delta, text=text, is_final=is_final)
         )
 
     async def _on_llm_reasoning_response(
@@ -217,7 +332,7 @@ class MeetingAgent:
         Internal callback for streaming LLM output, wrapped as an AgentEvent.
         """
         await self._emit_llm(
-            LLMResponseEvent(
+            LLMResponseEvent.acquire(
                 delta=delta, text=text, is_final=is_final, type="reasoning"
             )
         )
@@ -244,22 +359,47 @@ class MeetingAgent:
         """
         await self.llm_exec.flush()
 
-        # Clear queue
-        while not self._llm_queue.empty():
-            try:
-                self._llm_queue.get_nowait()
-                self._llm_queue.task_done()
-            except asyncio.QueueEmpty:
-                break
-
-        # Cancel active LLM task
-        if self._llm_active_task and not self._llm_active_task.done():
-            self._llm_active_task.cancel()
-            try:
-                await self._llm_active_task
-            except asyncio.CancelledError:
-                pass
-            self._llm_active_task = None
+        # Clear pending responses in O(1)
+        self._llm_deque.clear()
+        self._llm_event.clear()
+
+        # Stop in-flight dispatch at the next handler boundary, but never
+        # hang the caller on a handler stuck in a non-cancellable await.
+        self._llm_cancelled = True
+        try:
+            await asyncio.wait_for(self._llm_idle.wait(), timeout=1.0)
+        except asyncio.TimeoutError:
+            self.ten_env.log_warn(
+                "[Agent] flush_llm timed out waiting for the active handler"
+            )
+
+    # Seconds to wait for more final ASR results before extracting actions.
+    _ACTION_BATCH_WINDOW = 0.5
+
+    async def _flush_action_batch_after(self, delay: float):
+        await asyncio.sleep(delay)
+        await self._flush_action_batch()
+
+    async def _flush_action_batch(self):
+        """Run action extraction once over all batched final ASR results."""
+        batch, self._action_batch = self._action_batch, []
+        if not batch or not self.meeting_active:
+            return
+
+        speakers = {speaker for _, speaker in batch}
+        if len(speakers) == 1:
+            text = "\n".join(t for t, _ in batch)
+            speaker_id = batch[0][1]
+        else:
+            # Mixed speakers: tag each line so assignee extraction still works.
+            text = "\n".join(f"{speaker}: {t}" if speaker else t for t, speaker in batch)
+            speaker_id = None
+
+        action_events = await self.action_extractor.extract_action_items(
+            text, self.current_meeting_id, speaker_id
+        )
+        for action_event in action_events:
+            await self._emit_meeting(action_event)
 
     def _register_default_handlers(self):
         """Register default handlers for meeting events."""
@@ -269,13 +409,13 @@ class MeetingAgent:
             if self.meeting_active:
                 await self.meeting_processor.process_asr_result(event)
 
-                # Extract action items from final ASR results
+                # Batch final ASR results for action extraction
                 if event.final and event.text.strip():
-                    action_events = await self.action_extractor.extract_action_items(
-                        event.text, self.current_meeting_id, event.speaker_id
-                    )
-                    for action_event in action_events:
-                        await self._emit_meeting(action_event)
+                    self._action_batch.append((event.text, event.speaker_id))
+                    if self._action_batch_task is None or self._action_batch_task.done():
+                        self._action_batch_task = asyncio.create_task(
+                            self._flush_action_batch_after(self._ACTION_BATCH_WINDOW)
+                        )
 
         @self.on(MeetingStartEvent)
         async def handle_meeting_start(event: MeetingStartEvent):
@@ -287,32 +427,48 @@ class MeetingAgent:
                 self.meeting_active = True
                 self.ten_env.log_info(f"Meeting {event.meeting_id} started successfully")
 
-                # Send greeting message
-                greeting = f"会议已开始。参与者：{', '.join(event.participants)}。"
+                # Send greeting message; one join, no incremental += copies
+                parts = ["会议已开始。参与者：", ", ".join(event.participants), "。"]
                 if event.agenda:
-                    greeting += f" 议程：{event.agenda}"
-                await self._send_text_data(greeting, is_final=True)
+                    parts.append(" 议程：")
+                    parts.append(event.agenda)
+                await self._send_text_data("".join(parts), is_final=True)
 
         @self.on(MeetingEndEvent)
         async def handle_meeting_end(event: MeetingEndEvent):
             if self.current_meeting_id:
+                # Extract whatever is still batched before closing the meeting
+                if self._action_batch_task and not self._action_batch_task.done():
+                    self._action_batch_task.cancel()
+                await self._flush_action_batch()
+
                 summary = await self.meeting_processor.end_meeting(self.current_meeting_id)
                 if summary:
-                    # Generate final summary
-                    summary_event = await self.summary_generator.generate_final_summary(summary)
+                    # Final summary and calendar scheduling are independent
+                    # I/O-bound calls; overlap them so post-meeting wall time
+                    # is the slowest of the three, not their sum.
+                    action_items = self.action_extractor.get_action_items(self.current_meeting_id)
+                    followups_task = reminders_task = None
+                    async with asyncio.TaskGroup() as tg:
+                        summary_task = tg.create_task(
+                            self.summary_generator.generate_final_summary(summary)
+                        )
+                        if action_items:
+                            followups_task = tg.create_task(
+                                self.calendar_manager.schedule_follow_up_meetings(action_items)
+                            )
+                            reminders_task = tg.create_task(
+                                self.calendar_manager.schedule_deadline_reminders(action_items)
+                            )
+
+                    summary_event = summary_task.result()
                     if summary_event:
                         await self._emit_meeting(summary_event)
 
-                    # Schedule follow-up meetings
-                    action_items = self.action_extractor.get_action_items(self.current_meeting_id)
-                    if action_items:
-                        calendar_events = await self.calendar_manager.schedule_follow_up_meetings(action_items)
-                        for cal_event in calendar_events:
+                    if followups_task:
+                        for cal_event in followups_task.result():
                             await self._emit_meeting(cal_event)
-
-                        # Schedule deadline reminders
-                        reminder_events = await self.calendar_manager.schedule_deadline_reminders(action_items)
-                        for reminder_event in reminder_events:
+                        for reminder_event in reminders_task.result():
                             await self._emit_meeting(reminder_event)
 
                 self.meeting_active = False
@@ -323,7 +479,7 @@ class MeetingAgent:
         async def handle_summary_generated(event: SummaryGeneratedEvent):
             # Send summary to UI
             summary_text = f"[{event.summary_type.upper()} 总结] {event.content}"
-            await self._send_text_data(summary_text, is_final=True)
+            self._queue_text_data(summary_text)
 
         @self.on(ActionItemEvent)
         async def handle_action_item(event: ActionItemEvent):
@@ -332,20 +488,36 @@ class MeetingAgent:
             if event.assignee:
                 action_text += f" (负责人: {event.assignee})"
             if event.deadline:
-                action_text += f" (截止: {event.deadline.strftime('%Y-%m-%d')})"
-            await self._send_text_data(action_text, is_final=True)
+                # isoformat slicing skips strftime's format-string parse
+                action_text += f" (截止: {event.deadline.isoformat()[:10]})"
+            self._queue_text_data(action_text)
 
         @self.on(CalendarEventEvent)
         async def handle_calendar_event(event: CalendarEventEvent):
             # Send calendar event notification
-            calendar_text = f"[日程安排] {event.event_title} - {event.event_time.strftime('%Y-%m-%d %H:%M')}"
-            await self._send_text_data(calendar_text, is_final=True)
+            calendar_text = f"[日程安排] {event.event_title} - {event.event_time.isoformat(sep=' ', timespec='minutes')}"
+            self._queue_text_data(calendar_text)
+
+    def _queue_text_data(self, text: str):
+        """Buffer a notification line and schedule a flush on the next loop turn."""
+        self._outbound_buffer.append(text)
+        if self._outbound_flush_task is None or self._outbound_flush_task.done():
+            self._outbound_flush_task = asyncio.create_task(self._flush_outbound())
+
+    async def _flush_outbound(self):
+        """Flush buffered notifications as a single text_data frame."""
+        # Yield once so every notification emitted in the same burst lands in
+        # the buffer before it is drained.
+        await asyncio.sleep(0)
+        if not self._outbound_buffer:
+            return
+        text = "\n".join(self._outbound_buffer)
+        self._outbound_buffer.clear()
+        await self._send_text_data(text, is_final=True)
 
     async def _send_text_data(self, text: str, is_final: bool = False, stream_id: int = 0):
         """Send text data back to the client."""
         try:
-            from ten_runtime import Data
-
             text_data = Data.create("text_data")
             text_data.set_property_string("text", text)
             text_data.set_property_bool("is_final", is_final)
@@ -361,7 +533,7 @@ class MeetingAgent:
 
     async def start_meeting(self, participants: list = None, agenda: str = None) -> str:
         """Start a new meeting programmatically."""
-        meeting_id = str(uuid.uuid4())
+        meeting_id = uuid.uuid4().hex
         await self._emit_meeting(MeetingStartEvent(
             meeting_id=meeting_id,
             participants=participants or [],
@@ -464,14 +636,13 @@ class MeetingAgent:
 
         await self.llm_exec.stop()
         await self.flush_llm()
+        await self._flush_outbound()
+        await self.action_extractor.close()
+        await self.calendar_manager.close()
 
-        # Cancel all consumers
-        if self._asr_consumer:
-            self._asr_consumer.cancel()
+        # Cancel the LLM consumer
         if self._llm_consumer:
             self._llm_consumer.cancel()
-        if self._meeting_consumer:
-            self._meeting_consumer.cancel()
 
 # For backward compatibility, keep the Agent class name
 Agent = MeetingAgent
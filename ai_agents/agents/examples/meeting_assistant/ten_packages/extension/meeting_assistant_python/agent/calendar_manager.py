@@ -1,10 +1,84 @@
 import asyncio
-import uuid
+import bisect
+import functools
+import itertools
+import json
+import secrets
+import time
+from collections import Counter, OrderedDict, defaultdict
 from datetime import datetime, timedelta
+from operator import attrgetter
 from typing import Dict, List, Optional, Union
 from ten_runtime import AsyncTenEnv
 from .events import ActionItem, CalendarEventEvent, MeetingSummary
 
+try:
+    import aiohttp
+except ImportError:  # webhook sync is disabled without aiohttp
+    aiohttp = None
+
+try:
+    import orjson
+except ImportError:  # aiohttp's stdlib-json path is the fallback
+    orjson = None
+
+# Sort key for the per-meeting event lists kept ordered by start time.
+_START_KEY = attrgetter("start_time")
+
+# One random read at import plus a counter per event: same scheme the
+# action extractor uses, and the monotonic suffix sorts by creation order.
+_ID_PREFIX = secrets.token_hex(4)
+_id_counter = itertools.count()
+
+
+def _next_event_id() -> str:
+    return f"{_ID_PREFIX}-{next(_id_counter):08x}"
+
+
+# Deadlines repeat across actions and scheduling passes; datetimes are
+# hashable, so derived values are memoized on the value itself. ActionItem
+# is slotted, which rules out cached_property on the model.
+@functools.lru_cache(maxsize=256)
+def _deadline_week(deadline: datetime) -> int:
+    return deadline.isocalendar().week
+
+
+@functools.lru_cache(maxsize=256)
+def _deadline_str(deadline: datetime) -> str:
+    return deadline.strftime('%Y-%m-%d %H:%M')
+
+# Description templates, resolved once at import instead of re-parsing
+# f-strings (and re-evaluating chr(10)) on every scheduled event.
+_REVIEW_TMPL = """
+Review meeting for: {title}
+Original meeting date: {date}
+
+Key items to review:
+{points}
+
+Action items to check:
+{actions}
+"""
+
+_FOLLOW_UP_TMPL = """
+Follow-up meeting to discuss progress on action items:
+
+{actions}
+
+Original meeting: {meeting_id}
+"""
+
+_REMINDER_TMPL = """
+Reminder for action item: {action}
+
+Assignee: {assignee}
+Deadline: {deadline}
+Priority: {priority}
+Meeting: {meeting_id}
+
+This is a {reminder_type} reminder.
+"""
+
 
 class CalendarEvent:
     """Calendar event data model."""
@@ -21,7 +95,8 @@ class CalendarEvent:
         meeting_type: str = "follow_up",
         related_meeting_id: Optional[str] = None,
         related_action_id: Optional[str] = None,
-        recurrence: Optional[str] = None
+        recurrence: Optional[str] = None,
+        created_at: Optional[datetime] = None
     ):
         self.id = id
         self.title = title
@@ -34,21 +109,45 @@ class CalendarEvent:
         self.related_meeting_id = related_meeting_id
         self.related_action_id = related_action_id
         self.recurrence = recurrence
-        self.created_at = datetime.now()
+        self.created_at = created_at or datetime.now()
         self.status = "scheduled"
 
 
 class CalendarManager:
     """Manager for creating and managing calendar events based on meeting outcomes."""
 
+    # Recently-synced (event_id, backend) pairs are skipped to avoid
+    # hitting external calendars twice for the same event.
+    _SYNC_TTL = 300.0  # seconds
+    _SYNC_CACHE_CAP = 1024
+
+    __slots__ = (
+        "ten_env",
+        "scheduled_events",
+        "_events_by_id",
+        "_recent_syncs",
+        "calendar_apis",
+        "auto_scheduling",
+        "default_meeting_duration",
+        "_bh_start",
+        "_bh_end",
+        "_excluded_days",
+    )
+
     def __init__(self, ten_env: AsyncTenEnv):
         self.ten_env = ten_env
+        # Per-meeting lists kept sorted by start_time (bisect.insort), so
+        # upcoming counts and conflict checks are range queries, not scans.
         self.scheduled_events: Dict[str, List[CalendarEvent]] = {}
+        # Secondary index so cancel_event is a dict lookup, not a list scan
+        self._events_by_id: Dict[str, CalendarEvent] = {}
+        self._recent_syncs: OrderedDict = OrderedDict()  # (event_id, backend) -> monotonic ts
         self.calendar_apis = {}  # Will store different calendar API clients
         self.auto_scheduling = True
         self.default_meeting_duration = 60  # minutes
-        self.business_hours = {"start": 9, "end": 18}  # 9 AM to 6 PM
-        self.excluded_days = [5, 6]  # Saturday, Sunday (0=Monday)
+        self._bh_start = 9  # business hours: 9 AM to 6 PM
+        self._bh_end = 18
+        self._excluded_days = frozenset({5, 6})  # Saturday, Sunday (0=Monday)
 
     async def initialize_calendar_apis(self, config: Dict):
         """Initialize calendar API clients."""
@@ -74,16 +173,21 @@ class CalendarManager:
         """Schedule follow-up meetings based on action items."""
         try:
             calendar_events = []
+            pending_sync: List[CalendarEvent] = []
+            now = datetime.now()  # one clock read for the whole pass
 
             # Group action items by assignee and deadline
             grouped_actions = self._group_actions_for_scheduling(action_items)
 
             for group_key, actions in grouped_actions.items():
                 if len(actions) > 1:  # Multiple related actions
-                    event = await self._create_follow_up_meeting(actions)
+                    event = await self._create_follow_up_meeting(actions, pending_sync=pending_sync, _now=now)
                     if event:
                         calendar_events.append(event)
 
+            # One bulk sync for the whole pass instead of one per meeting
+            await self._sync_batch_to_external_calendars(pending_sync)
+
             return calendar_events
 
         except Exception as e:
@@ -93,36 +197,32 @@ class CalendarManager:
     async def schedule_review_meeting(self, meeting_summary: MeetingSummary, days_ahead: int = 7) -> Optional[CalendarEventEvent]:
         """Schedule a review meeting based on the original meeting outcomes."""
         try:
-            review_time = datetime.now() + timedelta(days=days_ahead)
+            now = datetime.now()
+            review_time = now + timedelta(days=days_ahead)
             review_time = self._adjust_to_business_hours(review_time)
 
             title = f"Review Meeting: {meeting_summary.title}"
-            description = f"""
-Review meeting for: {meeting_summary.title}
-Original meeting date: {meeting_summary.date.strftime('%Y-%m-%d')}
-
-Key items to review:
-{chr(10).join([f"- {point}" for point in meeting_summary.key_points[:5]])}
-
-Action items to check:
-{chr(10).join([f"- {item.action}" for item in meeting_summary.action_items[:5]])}
-"""
+            description = _REVIEW_TMPL.format(
+                title=meeting_summary.title,
+                date=meeting_summary.date.strftime('%Y-%m-%d'),
+                points="\n".join(f"- {point}" for point in meeting_summary.key_points[:5]),
+                actions="\n".join(f"- {item.action}" for item in meeting_summary.action_items[:5]),
+            )
 
             event = CalendarEvent(
-                id=str(uuid.uuid4()),
+                id=_next_event_id(),
                 title=title,
                 start_time=review_time,
                 end_time=review_time + timedelta(minutes=self.default_meeting_duration),
                 description=description,
                 participants=[p.id for p in meeting_summary.participants],
                 meeting_type="review",
-                related_meeting_id=meeting_summary.meeting_id
+                related_meeting_id=meeting_summary.meeting_id,
+                created_at=now
             )
 
             # Store the event
-            if meeting_summary.meeting_id not in self.scheduled_events:
-                self.scheduled_events[meeting_summary.meeting_id] = []
-            self.scheduled_events[meeting_summary.meeting_id].append(event)
+            self._store_event(meeting_summary.meeting_id, event)
 
             # Create calendar event
             calendar_event = CalendarEventEvent(
@@ -147,23 +247,41 @@ Action items to check:
         """Schedule reminder events for action item deadlines."""
         try:
             reminder_events = []
+            pending_sync: List[CalendarEvent] = []
+            # One clock read per pass: keeps borderline reminders from being
+            # valid on one check and expired on the next within the same loop.
+            # Thresholds are precomputed so the loop compares deadlines
+            # directly and only builds a timedelta for actions that qualify.
+            now = datetime.now()
+            day_ahead = now + timedelta(days=1)
+            week_ahead = now + timedelta(days=7)
+            one_day = timedelta(days=1)
+            one_week = timedelta(days=7)
 
             for action in action_items:
-                if action.deadline:
-                    # Schedule reminder 1 day before deadline
-                    reminder_time = action.deadline - timedelta(days=1)
-                    if reminder_time > datetime.now():
-                        reminder_event = await self._create_reminder_event(action, reminder_time)
-                        if reminder_event:
-                            reminder_events.append(reminder_event)
-
-                    # Schedule reminder 1 week before deadline (for longer-term tasks)
-                    if action.deadline > datetime.now() + timedelta(days=7):
-                        week_reminder = action.deadline - timedelta(days=7)
-                        if week_reminder > datetime.now():
-                            reminder_event = await self._create_reminder_event(action, week_reminder, "week")
-                            if reminder_event:
-                                reminder_events.append(reminder_event)
+                deadline = action.deadline
+                if deadline is None:
+                    continue
+
+                # Schedule reminder 1 day before deadline
+                if deadline > day_ahead:
+                    reminder_event = await self._create_reminder_event(
+                        action, deadline - one_day, pending_sync=pending_sync, _now=now
+                    )
+                    if reminder_event:
+                        reminder_events.append(reminder_event)
+
+                # Schedule reminder 1 week before deadline (for longer-term tasks)
+                # deadline > week_ahead already implies deadline - 7d > now
+                if deadline > week_ahead:
+                    reminder_event = await self._create_reminder_event(
+                        action, deadline - one_week, "week", pending_sync=pending_sync, _now=now
+                    )
+                    if reminder_event:
+                        reminder_events.append(reminder_event)
+
+            # Up to two reminders per action collapse into one bulk sync
+            await self._sync_batch_to_external_calendars(pending_sync)
 
             return reminder_events
 
@@ -171,45 +289,47 @@ Action items to check:
             self.ten_env.log_error(f"Failed to schedule deadline reminders: {e}")
             return []
 
-    async def _create_follow_up_meeting(self, actions: List[ActionItem]) -> Optional[CalendarEventEvent]:
+    async def _create_follow_up_meeting(self, actions: List[ActionItem], pending_sync: Optional[List[CalendarEvent]] = None, _now: Optional[datetime] = None) -> Optional[CalendarEventEvent]:
         """Create a follow-up meeting for related action items."""
         try:
             if not actions:
                 return None
 
+            now = _now or datetime.now()
+
             # Find the earliest deadline
             earliest_deadline = min([a.deadline for a in actions if a.deadline], default=None)
             if earliest_deadline:
                 meeting_time = earliest_deadline - timedelta(days=2)  # 2 days before deadline
             else:
-                meeting_time = datetime.now() + timedelta(days=3)  # 3 days from now
+                meeting_time = now + timedelta(days=3)  # 3 days from now
 
             meeting_time = self._adjust_to_business_hours(meeting_time)
 
             # Get all assignees
-            assignees = list(set([a.assignee for a in actions if a.assignee]))
+            assignees = list({a.assignee for a in actions if a.assignee})
 
             title = f"Follow-up: {actions[0].action[:50]}..."
             if len(actions) > 1:
                 title = f"Follow-up Meeting ({len(actions)} items)"
 
-            description = f"""
-Follow-up meeting to discuss progress on action items:
-
-{chr(10).join([f"- {action.action} (Assignee: {action.assignee or 'TBD'})" for action in actions])}
-
-Original meeting: {actions[0].meeting_id}
-"""
+            description = _FOLLOW_UP_TMPL.format(
+                actions="\n".join(
+                    f"- {action.action} (Assignee: {action.assignee or 'TBD'})" for action in actions
+                ),
+                meeting_id=actions[0].meeting_id,
+            )
 
             event = CalendarEvent(
-                id=str(uuid.uuid4()),
+                id=_next_event_id(),
                 title=title,
                 start_time=meeting_time,
                 end_time=meeting_time + timedelta(minutes=self.default_meeting_duration),
                 description=description,
                 participants=assignees,
                 meeting_type="follow_up",
-                related_meeting_id=actions[0].meeting_id
+                related_meeting_id=actions[0].meeting_id,
+                created_at=now
             )
 
             calendar_event = CalendarEventEvent(
@@ -222,12 +342,13 @@ Original meeting: {actions[0].meeting_id}
                 action_item_id=actions[0].id
             )
 
-            # Store and sync
-            if actions[0].meeting_id not in self.scheduled_events:
-                self.scheduled_events[actions[0].meeting_id] = []
-            self.scheduled_events[actions[0].meeting_id].append(event)
+            # Store and sync (deferred to the caller's bulk sync when batching)
+            self._store_event(actions[0].meeting_id, event)
 
-            await self._sync_to_external_calendars(event)
+            if pending_sync is None:
+                await self._sync_to_external_calendars(event)
+            else:
+                pending_sync.append(event)
 
             return calendar_event
 
@@ -235,23 +356,21 @@ Original meeting: {actions[0].meeting_id}
             self.ten_env.log_error(f"Failed to create follow-up meeting: {e}")
             return None
 
-    async def _create_reminder_event(self, action: ActionItem, reminder_time: datetime, reminder_type: str = "day") -> Optional[CalendarEventEvent]:
+    async def _create_reminder_event(self, action: ActionItem, reminder_time: datetime, reminder_type: str = "day", pending_sync: Optional[List[CalendarEvent]] = None, _now: Optional[datetime] = None) -> Optional[CalendarEventEvent]:
         """Create a reminder event for an action item."""
         try:
             title = f"Reminder: {action.action[:50]}..."
-            description = f"""
-Reminder for action item: {action.action}
-
-Assignee: {action.assignee or 'TBD'}
-Deadline: {action.deadline.strftime('%Y-%m-%d %H:%M') if action.deadline else 'No deadline'}
-Priority: {action.priority}
-Meeting: {action.meeting_id}
-
-This is a {reminder_type} reminder.
-"""
+            description = _REMINDER_TMPL.format(
+                action=action.action,
+                assignee=action.assignee or 'TBD',
+                deadline=_deadline_str(action.deadline) if action.deadline else 'No deadline',
+                priority=action.priority,
+                meeting_id=action.meeting_id,
+                reminder_type=reminder_type,
+            )
 
             event = CalendarEvent(
-                id=str(uuid.uuid4()),
+                id=_next_event_id(),
                 title=title,
                 start_time=reminder_time,
                 end_time=reminder_time + timedelta(minutes=15),  # 15-minute reminder
@@ -259,7 +378,8 @@ This is a {reminder_type} reminder.
                 participants=[action.assignee] if action.assignee else [],
                 meeting_type="reminder",
                 related_meeting_id=action.meeting_id,
-                related_action_id=action.id
+                related_action_id=action.id,
+                created_at=_now or datetime.now()
             )
 
             calendar_event = CalendarEventEvent(
@@ -272,12 +392,13 @@ This is a {reminder_type} reminder.
                 action_item_id=action.id
             )
 
-            # Store and sync
-            if action.meeting_id not in self.scheduled_events:
-                self.scheduled_events[action.meeting_id] = []
-            self.scheduled_events[action.meeting_id].append(event)
+            # Store and sync (deferred to the caller's bulk sync when batching)
+            self._store_event(action.meeting_id, event)
 
-            await self._sync_to_external_calendars(event)
+            if pending_sync is None:
+                await self._sync_to_external_calendars(event)
+            else:
+                pending_sync.append(event)
 
             return calendar_event
 
@@ -285,64 +406,147 @@ This is a {reminder_type} reminder.
             self.ten_env.log_error(f"Failed to create reminder event: {e}")
             return None
 
-    def _group_actions_for_scheduling(self, actions: List[ActionItem]) -> Dict[str, List[ActionItem]]:
+    def _store_event(self, meeting_id: str, event: CalendarEvent):
+        """Insert an event keeping the per-meeting list sorted by start time."""
+        bisect.insort(self.scheduled_events.setdefault(meeting_id, []), event, key=_START_KEY)
+        self._events_by_id[event.id] = event
+
+    def check_conflict(self, meeting_id: str, start: datetime, end: datetime) -> List[CalendarEvent]:
+        """Return scheduled events overlapping the half-open interval [start, end)."""
+        events = self.scheduled_events.get(meeting_id, [])
+        # Only events starting before `end` can overlap; bisect bounds the scan.
+        hi = bisect.bisect_left(events, end, key=_START_KEY)
+        return [e for e in events[:hi] if e.end_time > start and e.status == "scheduled"]
+
+    def _group_actions_for_scheduling(self, actions: List[ActionItem]) -> Dict[tuple, List[ActionItem]]:
         """Group action items for efficient scheduling."""
-        groups = {}
+        groups: Dict[tuple, List[ActionItem]] = defaultdict(list)
 
         for action in actions:
-            # Group by assignee and deadline proximity
-            assignee = action.assignee or "unassigned"
-            deadline_week = action.deadline.isocalendar()[1] if action.deadline else "no_deadline"
-            group_key = f"{assignee}_{deadline_week}"
-
-            if group_key not in groups:
-                groups[group_key] = []
-            groups[group_key].append(action)
+            # Group by assignee and deadline proximity; a tuple key avoids
+            # formatting a throwaway string per action (-1 = no deadline)
+            deadline_week = _deadline_week(action.deadline) if action.deadline else -1
+            groups[(action.assignee or "unassigned", deadline_week)].append(action)
 
         # Only return groups with multiple items or high-priority single items
-        return {k: v for k, v in groups.items() if len(v) > 1 or (len(v) == 1 and v[0].priority == "high")}
+        return {k: v for k, v in groups.items() if len(v) > 1 or v[0].priority == "high"}
+
+    def _skip_excluded_days(self, dt: datetime) -> datetime:
+        """Advance past excluded weekdays with one jump instead of a day-by-day loop."""
+        wd = dt.weekday()
+        if wd not in self._excluded_days:
+            return dt
+        days_ahead = next(d for d in range(1, 8) if (wd + d) % 7 not in self._excluded_days)
+        return dt + timedelta(days=days_ahead)
 
     def _adjust_to_business_hours(self, dt: datetime) -> datetime:
         """Adjust datetime to fall within business hours."""
         # Skip weekends
-        while dt.weekday() in self.excluded_days:
-            dt += timedelta(days=1)
+        dt = self._skip_excluded_days(dt)
 
         # Adjust to business hours
-        if dt.hour < self.business_hours["start"]:
-            dt = dt.replace(hour=self.business_hours["start"], minute=0, second=0)
-        elif dt.hour >= self.business_hours["end"]:
-            dt = dt.replace(hour=self.business_hours["start"], minute=0, second=0) + timedelta(days=1)
+        if dt.hour < self._bh_start:
+            dt = dt.replace(hour=self._bh_start, minute=0, second=0)
+        elif dt.hour >= self._bh_end:
+            dt = dt.replace(hour=self._bh_start, minute=0, second=0) + timedelta(days=1)
             # Check again for weekends
-            while dt.weekday() in self.excluded_days:
-                dt += timedelta(days=1)
+            dt = self._skip_excluded_days(dt)
 
         return dt
 
+    def _recently_synced(self, event_id: str, backend: str, now_ts: float) -> bool:
+        ts = self._recent_syncs.get((event_id, backend))
+        return ts is not None and now_ts - ts < self._SYNC_TTL
+
+    def _mark_synced(self, event_id: str, backend: str, now_ts: float):
+        cache = self._recent_syncs
+        cache[(event_id, backend)] = now_ts
+        cache.move_to_end((event_id, backend))
+        while len(cache) > self._SYNC_CACHE_CAP:
+            cache.popitem(last=False)
+
     async def _sync_to_external_calendars(self, event: CalendarEvent) -> bool:
         """Sync event to external calendar services."""
         try:
+            # Fan out to all enabled backends concurrently: wall time is the
+            # slowest round-trip instead of the sum of all three. Backends
+            # that synced this event within the TTL are skipped.
+            now_ts = time.monotonic()
+            backends = []
+            tasks = []
+            for backend, sync in (
+                ("google", self._sync_to_google_calendar),
+                ("outlook", self._sync_to_outlook_calendar),
+                ("webhook", self._sync_to_webhook),
+            ):
+                if backend in self.calendar_apis and not self._recently_synced(event.id, backend, now_ts):
+                    backends.append(backend)
+                    tasks.append(sync(event))
+
+            if not tasks:
+                return True
+
+            results = await asyncio.gather(*tasks, return_exceptions=True)
             success = True
+            for backend, result in zip(backends, results):
+                if isinstance(result, Exception):
+                    self.ten_env.log_error(f"Calendar sync failed: {result}")
+                    success = False
+                elif result:
+                    self._mark_synced(event.id, backend, now_ts)
+                else:
+                    success = False
+            return success
 
-            # Google Calendar
-            if "google" in self.calendar_apis:
-                google_success = await self._sync_to_google_calendar(event)
-                success &= google_success
-
-            # Outlook Calendar
-            if "outlook" in self.calendar_apis:
-                outlook_success = await self._sync_to_outlook_calendar(event)
-                success &= outlook_success
+        except Exception as e:
+            self.ten_env.log_error(f"Failed to sync to external calendars: {e}")
+            return False
 
-            # Webhook
+    async def _sync_batch_to_external_calendars(self, events: List[CalendarEvent]) -> bool:
+        """Sync a batch of events, using bulk endpoints where available."""
+        try:
+            if not events:
+                return True
+
+            now_ts = time.monotonic()
+            tasks = []
+            marks = []  # (event_ids, backend) recorded per task on success
+            # The Google/Outlook placeholders have no bulk API; fan their
+            # per-event calls out concurrently instead. Events a backend
+            # synced within the TTL are skipped.
+            for backend, sync in (
+                ("google", self._sync_to_google_calendar),
+                ("outlook", self._sync_to_outlook_calendar),
+            ):
+                if backend in self.calendar_apis:
+                    for event in events:
+                        if not self._recently_synced(event.id, backend, now_ts):
+                            tasks.append(sync(event))
+                            marks.append(([event.id], backend))
             if "webhook" in self.calendar_apis:
-                webhook_success = await self._sync_to_webhook(event)
-                success &= webhook_success
+                fresh = [e for e in events if not self._recently_synced(e.id, "webhook", now_ts)]
+                if fresh:
+                    tasks.append(self._sync_batch_to_webhook(fresh))
+                    marks.append(([e.id for e in fresh], "webhook"))
+
+            if not tasks:
+                return True
 
+            results = await asyncio.gather(*tasks, return_exceptions=True)
+            success = True
+            for (event_ids, backend), result in zip(marks, results):
+                if isinstance(result, Exception):
+                    self.ten_env.log_error(f"Calendar sync failed: {result}")
+                    success = False
+                elif result:
+                    for event_id in event_ids:
+                        self._mark_synced(event_id, backend, now_ts)
+                else:
+                    success = False
             return success
 
         except Exception as e:
-            self.ten_env.log_error(f"Failed to sync to external calendars: {e}")
+            self.ten_env.log_error(f"Failed to batch-sync to external calendars: {e}")
             return False
 
     async def _init_google_calendar(self, config: Dict):
@@ -378,10 +582,25 @@ This is a {reminder_type} reminder.
     async def _init_webhook_calendar(self, config: Dict):
         """Initialize webhook-based calendar integration."""
         try:
+            if aiohttp is None:
+                self.ten_env.log_error("aiohttp not installed; webhook calendar disabled")
+                return
+
+            # Headers are resolved once here; the session is shared across
+            # all webhook posts so TCP/TLS setup is paid once, not per event.
+            headers = dict(config.get("headers", {}))
+            if config.get("auth_token"):
+                headers["Authorization"] = f"Bearer {config['auth_token']}"
+
             self.calendar_apis["webhook"] = {
                 "url": config.get("webhook_url"),
-                "headers": config.get("headers", {}),
-                "auth_token": config.get("auth_token")
+                "headers": headers,
+                "auth_token": config.get("auth_token"),
+                "session": aiohttp.ClientSession(
+                    connector=aiohttp.TCPConnector(limit=32, ttl_dns_cache=300),
+                    timeout=aiohttp.ClientTimeout(total=10),
+                    headers=headers,
+                )
             }
             self.ten_env.log_info("Webhook calendar integration initialized")
 
@@ -414,49 +633,91 @@ This is a {reminder_type} reminder.
     async def _sync_to_webhook(self, event: CalendarEvent) -> bool:
         """Sync event via webhook."""
         try:
-            import json
-            import aiohttp
-
             webhook_config = self.calendar_apis.get("webhook", {})
-            if not webhook_config.get("url"):
+            session = webhook_config.get("session")
+            if not webhook_config.get("url") or session is None:
                 return False
 
-            payload = {
-                "event": {
-                    "id": event.id,
-                    "title": event.title,
-                    "start_time": event.start_time.isoformat(),
-                    "end_time": event.end_time.isoformat(),
-                    "description": event.description,
-                    "participants": event.participants,
-                    "location": event.location,
-                    "meeting_type": event.meeting_type,
-                    "related_meeting_id": event.related_meeting_id,
-                    "related_action_id": event.related_action_id
-                }
-            }
+            payload = {"event": self._webhook_event_payload(event)}
 
-            headers = webhook_config.get("headers", {})
-            if webhook_config.get("auth_token"):
-                headers["Authorization"] = f"Bearer {webhook_config['auth_token']}"
-
-            async with aiohttp.ClientSession() as session:
-                async with session.post(
-                    webhook_config["url"],
-                    json=payload,
-                    headers=headers
-                ) as response:
-                    if response.status == 200:
-                        self.ten_env.log_info(f"Synced event '{event.title}' via webhook")
-                        return True
-                    else:
-                        self.ten_env.log_error(f"Webhook sync failed with status {response.status}")
-                        return False
+            # Auth and custom headers already live on the shared session.
+            async with session.post(webhook_config["url"], **self._webhook_post_kwargs(payload)) as response:
+                if response.status == 200:
+                    self.ten_env.log_info(f"Synced event '{event.title}' via webhook")
+                    return True
+                else:
+                    self.ten_env.log_error(f"Webhook sync failed with status {response.status}")
+                    return False
 
         except Exception as e:
             self.ten_env.log_error(f"Failed to sync via webhook: {e}")
             return False
 
+    async def _sync_batch_to_webhook(self, events: List[CalendarEvent]) -> bool:
+        """Sync a batch of events via a single webhook POST."""
+        try:
+            webhook_config = self.calendar_apis.get("webhook", {})
+            session = webhook_config.get("session")
+            if not webhook_config.get("url") or session is None:
+                return False
+
+            payload = {"events": [self._webhook_event_payload(event) for event in events]}
+
+            async with session.post(webhook_config["url"], **self._webhook_post_kwargs(payload)) as response:
+                if response.status == 200:
+                    self.ten_env.log_info(f"Synced {len(events)} events via webhook")
+                    return True
+                else:
+                    self.ten_env.log_error(f"Webhook batch sync failed with status {response.status}")
+                    return False
+
+        except Exception as e:
+            self.ten_env.log_error(f"Failed to batch-sync via webhook: {e}")
+            return False
+
+    @staticmethod
+    def _webhook_event_payload(event: CalendarEvent) -> Dict:
+        """Serialize one event for the webhook payload."""
+        return {
+            "id": event.id,
+            "title": event.title,
+            "start_time": event.start_time,
+            "end_time": event.end_time,
+            "description": event.description,
+            "participants": event.participants,
+            "location": event.location,
+            "meeting_type": event.meeting_type,
+            "related_meeting_id": event.related_meeting_id,
+            "related_action_id": event.related_action_id
+        }
+
+    @staticmethod
+    def _webhook_post_kwargs(payload: Dict) -> Dict:
+        """Build post kwargs, serializing with orjson when available.
+
+        Datetimes stay raw in the payload: orjson writes them natively
+        (no OPT_NAIVE_UTC — these are naive local times, relabeling them
+        UTC would shift them), the stdlib path falls back to isoformat.
+        """
+        if orjson is not None:
+            body = orjson.dumps(payload, option=orjson.OPT_OMIT_MICROSECONDS)
+        else:
+            body = json.dumps(
+                payload,
+                default=lambda value: value.replace(microsecond=0).isoformat(),
+            ).encode()
+        return {"data": body, "headers": {"Content-Type": "application/json"}}
+
+    async def close(self):
+        """Release external resources held by the calendar integrations."""
+        try:
+            webhook_config = self.calendar_apis.get("webhook", {})
+            session = webhook_config.get("session")
+            if session is not None:
+                await session.close()
+        except Exception as e:
+            self.ten_env.log_error(f"Failed to close calendar manager: {e}")
+
     async def get_scheduled_events(self, meeting_id: str) -> List[CalendarEvent]:
         """Get all scheduled events for a meeting."""
         return self.scheduled_events.get(meeting_id, [])
@@ -464,14 +725,14 @@ This is a {reminder_type} reminder.
     async def cancel_event(self, event_id: str, meeting_id: str) -> bool:
         """Cancel a scheduled event."""
         try:
-            events = self.scheduled_events.get(meeting_id, [])
-            for event in events:
-                if event.id == event_id:
-                    event.status = "cancelled"
-                    # Cancel in external calendars
-                    await self._cancel_in_external_calendars(event)
-                    return True
-            return False
+            event = self._events_by_id.get(event_id)
+            if event is None or event.related_meeting_id != meeting_id:
+                return False
+
+            event.status = "cancelled"
+            # Cancel in external calendars
+            await self._cancel_in_external_calendars(event)
+            return True
 
         except Exception as e:
             self.ten_env.log_error(f"Failed to cancel event: {e}")
@@ -491,15 +752,22 @@ This is a {reminder_type} reminder.
     def get_calendar_stats(self, meeting_id: str) -> Dict:
         """Get statistics about scheduled events."""
         events = self.scheduled_events.get(meeting_id, [])
+        now = datetime.now()
 
-        stats = {
-            "total_events": len(events),
-            "follow_up_meetings": len([e for e in events if e.meeting_type == "follow_up"]),
-            "review_meetings": len([e for e in events if e.meeting_type == "review"]),
-            "reminders": len([e for e in events if e.meeting_type == "reminder"]),
-            "scheduled": len([e for e in events if e.status == "scheduled"]),
-            "cancelled": len([e for e in events if e.status == "cancelled"]),
-            "upcoming": len([e for e in events if e.start_time > datetime.now() and e.status == "scheduled"])
-        }
+        # One pass over the events instead of one comprehension per key
+        type_counts = Counter()
+        status_counts = Counter()
+        for e in events:
+            type_counts[e.meeting_type] += 1
+            status_counts[e.status] += 1
 
-        return stats
\ No newline at end of file
+        return {
+            "total_events": len(events),
+            "follow_up_meetings": type_counts["follow_up"],
+            "review_meetings": type_counts["review"],
+            "reminders": type_counts["reminder"],
+            "scheduled": status_counts["scheduled"],
+            "cancelled": status_counts["cancelled"],
+            # The list is sorted by start_time, so only the tail can be upcoming
+            "upcoming": sum(1 for e in events[bisect.bisect_right(events, now, key=_START_KEY):] if e.status == "scheduled")
+        }
\ No newline at end of file
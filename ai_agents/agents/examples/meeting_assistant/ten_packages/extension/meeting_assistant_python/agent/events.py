@@ -1,5 +1,6 @@
-from pydantic import BaseModel
-from typing import Literal, Union, Dict, Any, List, Optional
+from pydantic import BaseModel, Field, TypeAdapter
+from dataclasses import dataclass
+from typing import Annotated, ClassVar, Literal, Union, Dict, Any, List, Optional
 from datetime import datetime
 from ten_ai_base.types import LLMToolMetadata
 
@@ -78,7 +79,43 @@ class MeetingPhaseChangeEvent(AgentEventBase):
 # ==== DATA Events ====
 
 
-class ASRResultEvent(AgentEventBase):
+class PooledEventMixin:
+    """Per-class freelist for high-rate streaming events.
+
+    ASR partials and LLM deltas allocate thousands of short-lived event
+    objects per session; acquire() reuses a released instance (resetting
+    unset fields to their defaults) and release() returns it once dispatch
+    is done. The pool is capped so idle sessions do not retain memory.
+    """
+
+    _pool: ClassVar[list] = []
+    _POOL_CAP: ClassVar[int] = 64
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._pool = []
+
+    @classmethod
+    def acquire(cls, **fields):
+        pool = cls._pool
+        if not pool:
+            return cls(**fields)
+        event = pool.pop()
+        for name, field in cls.model_fields.items():
+            if name in fields:
+                setattr(event, name, fields[name])
+            elif not field.is_required():
+                setattr(event, name, field.get_default())
+        return event
+
+    def release(self) -> None:
+        """Return this event to its class pool after dispatch completes."""
+        pool = type(self)._pool
+        if len(pool) < self._POOL_CAP:
+            pool.append(self)
+
+
+class ASRResultEvent(PooledEventMixin, AgentEventBase):
     """Event triggered when ASR result is received (partial or final)."""
 
     type: Literal["data"] = "data"
@@ -90,7 +127,7 @@ class ASRResultEvent(AgentEventBase):
     confidence: Optional[float] = None
 
 
-class LLMResponseEvent(AgentEventBase):
+class LLMResponseEvent(PooledEventMixin, AgentEventBase):
     """Event triggered when LLM returns a streaming response."""
 
     type: Literal["message", "reasoning"] = "message"
@@ -171,22 +208,33 @@ class CalendarEventEvent(AgentEventBase):
 # ==== Data Models ====
 
 
-class ActionItem(BaseModel):
-    """Action item data model."""
+@dataclass(slots=True)
+class ActionItem:
+    """Action item data model.
+
+    A slotted dataclass rather than a BaseModel: thousands of these
+    accumulate per long-running session and they never cross a validation
+    boundary, so the per-instance __dict__ would be pure overhead.
+    """
 
     id: str
     action: str
+    created_at: datetime
+    meeting_id: str
+    source_text: str
     assignee: Optional[str] = None
     deadline: Optional[datetime] = None
     priority: str = "medium"
     status: str = "pending"
-    created_at: datetime
-    meeting_id: str
-    source_text: str
 
 
-class MeetingParticipant(BaseModel):
-    """Meeting participant data model."""
+@dataclass(slots=True)
+class MeetingParticipant:
+    """Meeting participant data model.
+
+    Slotted dataclass like ActionItem: internal bookkeeping only, never
+    validated, and mutated on every transcript line.
+    """
 
     id: str
     name: str
@@ -195,7 +243,8 @@ class MeetingParticipant(BaseModel):
     contributions: int = 0
 
 
-class MeetingSummary(BaseModel):
+@dataclass(slots=True)
+class MeetingSummary:
     """Meeting summary data model."""
 
     meeting_id: str
@@ -203,28 +252,37 @@ class MeetingSummary(BaseModel):
     date: datetime
     duration: int
     participants: List[MeetingParticipant]
-    agenda: Optional[str] = None
     key_points: List[str]
     decisions: List[str]
     action_items: List[ActionItem]
     next_steps: List[str]
     summary: str
+    agenda: Optional[str] = None
 
 
 # ==== Unified Event Union ====
 
-AgentEvent = Union[
-    UserJoinedEvent,
-    UserLeftEvent,
-    ToolRegisterEvent,
-    ASRResultEvent,
-    LLMResponseEvent,
-    MeetingStartEvent,
-    MeetingEndEvent,
-    MeetingPhaseChangeEvent,
-    ActionItemEvent,
-    SummaryGeneratedEvent,
-    KeyPointEvent,
-    DecisionEvent,
-    CalendarEventEvent,
+# Discriminated on the unique `name` literal so validating an inbound
+# dict is one table lookup instead of trying all thirteen members.
+AgentEvent = Annotated[
+    Union[
+        UserJoinedEvent,
+        UserLeftEvent,
+        ToolRegisterEvent,
+        ASRResultEvent,
+        LLMResponseEvent,
+        MeetingStartEvent,
+        MeetingEndEvent,
+        MeetingPhaseChangeEvent,
+        ActionItemEvent,
+        SummaryGeneratedEvent,
+        KeyPointEvent,
+        DecisionEvent,
+        CalendarEventEvent,
+    ],
+    Field(discriminator="name"),
 ]
+
+# Built once at import; callers parsing raw event dicts should use
+# AGENT_EVENT_ADAPTER.validate_python(d) rather than ad-hoc parsing.
+AGENT_EVENT_ADAPTER = TypeAdapter(AgentEvent)
@@ -1,24 +1,198 @@
 import asyncio
+import dataclasses
+import functools
+import io
+import json
+import re
+import time
 import uuid
+from collections import OrderedDict, deque
+from dataclasses import dataclass, field
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Set, Tuple
+from typing import Deque, Dict, List, Optional, Set, Tuple
 from ten_runtime import AsyncTenEnv
 from .events import *
 
+try:
+    import ahocorasick
+except ImportError:  # the fused-regex scan below is the fallback
+    ahocorasick = None
+
+try:
+    import orjson
+except ImportError:  # stdlib json is the fallback
+    orjson = None
+
+# CJK text carries no space-delimited words; detect it once per utterance
+_CJK_RE = re.compile("[\u4e00-\u9fff]")
+
+# Lowercasing is only needed when ASCII uppercase is actually present;
+# one C-level scan beats allocating a lowered copy of every utterance
+_ASCII_UPPER_RE = re.compile("[A-Z]")
+
+
+@dataclass(slots=True)
+class MeetingState:
+    """Per-meeting state, slotted like the other internal data models.
+
+    Attribute access replaces a string hash + dict probe per field, and
+    the transcript stays columnar (parallel lists) as before.
+    """
+
+    id: str
+    start_time: datetime  # wall clock, for display/export
+    start_monotonic: float  # for duration math
+    agenda: Optional[str] = None
+    transcript_text: List[str] = field(default_factory=list)
+    transcript_speaker: List[str] = field(default_factory=list)
+    transcript_ts: List[datetime] = field(default_factory=list)
+    transcript_final: List[bool] = field(default_factory=list)
+    key_points: List[Dict] = field(default_factory=list)
+    decisions: List[Dict] = field(default_factory=list)
+    action_items: List[Dict] = field(default_factory=list)
+    participants: List[str] = field(default_factory=list)
+    phase_history: List[Dict] = field(default_factory=list)
+    end_time: Optional[datetime] = None
+    duration: int = 0
+
 
 class MeetingProcessor:
     """Core processor for handling meeting-specific logic."""
 
+    # Phase detection keywords
+    _PHASE_KEYWORDS = {
+        "opening": ["开始", "开会", "欢迎", "agenda", "议程"],
+        "discussion": ["讨论", "discuss", "think about", "认为", "观点"],
+        "decision_making": ["决定", "decide", "确定", "同意", "agree"],
+        "action_planning": ["行动", "action", "下一步", "next step", "安排", "plan"],
+        "closing": ["结束", "end", "总结", "summary", "散会"]
+    }
+
+    # New transcript lines that trigger a real-time summary early
+    _SUMMARY_BATCH_LINES = 20
+
+    # Ended meetings kept in memory for export/status before eviction
+    _MAX_RETAINED_MEETINGS = 16
+
+    # Forward progression of phases; rank table gives O(1) ordering checks
+    _PHASE_ORDER = ("opening", "discussion", "decision_making", "action_planning", "closing")
+    _PHASE_RANK = {phase: rank for rank, phase in enumerate(_PHASE_ORDER)}
+
+    # Decision keywords
+    _DECISION_KEYWORDS = ["决定", "decide", "确定", "同意", "agree", "resolved", "concluded"]
+
+    # Action item keywords
+    _ACTION_KEYWORDS = ["需要", "should", "will do", "负责", "安排", "plan to", "action"]
+
+    # Key point keywords
+    _KEY_KEYWORDS = ["重要", "important", "关键", "key", "crucial", "主要"]
+
+    @staticmethod
+    def _keyword_tags() -> Dict[str, tuple]:
+        """Map each keyword to all (category, phase) tags it carries.
+
+        Several keywords belong to more than one category ("决定" marks
+        both the decision_making phase and a decision), so values are
+        tuples of tags rather than a single tag.
+        """
+        tags: Dict[str, list] = {}
+        for phase, keywords in MeetingProcessor._PHASE_KEYWORDS.items():
+            for keyword in keywords:
+                tags.setdefault(keyword, []).append(("phase", phase))
+        for category, keywords in (
+            ("decision", MeetingProcessor._DECISION_KEYWORDS),
+            ("action", MeetingProcessor._ACTION_KEYWORDS),
+            ("key", MeetingProcessor._KEY_KEYWORDS),
+        ):
+            for keyword in keywords:
+                tags.setdefault(keyword, []).append((category, None))
+        return {keyword: tuple(tag_list) for keyword, tag_list in tags.items()}
+
+    @staticmethod
+    @functools.cache
+    def _build_keyword_automatons():
+        """One Aho-Corasick scan replaces ~30 Python-level `in` tests.
+
+        Split like the action extractor's automatons: CJK keywords match
+        the raw text, ASCII keywords the lowercased copy.
+        """
+        if ahocorasick is None:
+            return None
+
+        cjk = ahocorasick.Automaton()
+        ascii_ = ahocorasick.Automaton()
+        for keyword, tags in MeetingProcessor._keyword_tags().items():
+            if keyword.isascii():
+                ascii_.add_word(keyword.lower(), tags)
+            else:
+                cjk.add_word(keyword, tags)
+        cjk.make_automaton()
+        ascii_.make_automaton()
+        return cjk, ascii_
+
+    @staticmethod
+    @functools.cache
+    def _compile_keyword_regex():
+        """Fallback: fused alternation compiled once, still one C-level scan.
+
+        IGNORECASE lets it run on the raw text, skipping the lowercased
+        copy the automaton path needs.
+        """
+        tag_map = MeetingProcessor._keyword_tags()
+        pattern = "|".join(
+            f"(?P<k{i}>{re.escape(keyword)})" for i, keyword in enumerate(tag_map)
+        )
+        group_tags = {f"k{i}": tags for i, tags in enumerate(tag_map.values())}
+        return re.compile(pattern, re.IGNORECASE), group_tags
+
+    def _scan_keywords(self, text: str) -> Tuple[Set[str], Set[str]]:
+        """Scan the text once, returning (categories hit, phases hit)."""
+        categories: Set[str] = set()
+        phases: Set[str] = set()
+
+        def collect(tags):
+            for category, phase in tags:
+                if phase is None:
+                    categories.add(category)
+                else:
+                    phases.add(phase)
+
+        automatons = self._build_keyword_automatons()
+        if automatons is not None:
+            cjk, ascii_ = automatons
+            for _, tags in cjk.iter(text):
+                collect(tags)
+            # CJK keywords are caseless and the ASCII keyword keys are
+            # already lowercase, so the copy is skipped unless the text
+            # actually contains ASCII uppercase
+            lowered = text.lower() if _ASCII_UPPER_RE.search(text) else text
+            for _, tags in ascii_.iter(lowered):
+                collect(tags)
+        else:
+            regex, group_tags = self._compile_keyword_regex()
+            for match in regex.finditer(text):
+                collect(group_tags[match.lastgroup])
+
+        return categories, phases
+
     def __init__(self, ten_env: AsyncTenEnv):
         self.ten_env = ten_env
         self.current_meeting: Optional[str] = None
-        self.meeting_data: Dict[str, Dict] = {}
+        # LRU-ordered; ended meetings beyond the retention cap are evicted
+        # so a long-running service does not accumulate them forever
+        self.meeting_data: OrderedDict = OrderedDict()
         self.participants: Dict[str, MeetingParticipant] = {}
-        self.transcript_buffer: List[Tuple[str, str, datetime]] = []
+        # Only the most recent utterances feed real-time summaries; the
+        # maxlen bounds memory for arbitrarily long meetings.
+        self.transcript_buffer: Deque[Tuple[str, str, datetime]] = deque(maxlen=32)
         self.current_phase: str = "not_started"
         self.last_activity: datetime = datetime.now()
         self.summary_interval: int = 300  # 5 minutes
         self.auto_summary_task: Optional[asyncio.Task] = None
+        # Adaptive batching: summarize after a burst of new lines or the
+        # interval elapsing, whichever comes first, and skip idle ticks
+        self._lines_since_summary: int = 0
+        self._summary_trigger = asyncio.Event()
 
         # Meeting phases
         self.phases = {
@@ -36,22 +210,20 @@ class MeetingProcessor:
             if self.current_meeting:
                 await self.end_meeting(self.current_meeting)
 
+            now = datetime.now()
             self.current_meeting = meeting_id
             self.current_phase = "opening"
-            self.last_activity = datetime.now()
+            self.last_activity = now
 
             # Initialize meeting data
-            self.meeting_data[meeting_id] = {
-                "id": meeting_id,
-                "start_time": datetime.now(),
-                "agenda": agenda,
-                "transcript": [],
-                "key_points": [],
-                "decisions": [],
-                "action_items": [],
-                "participants": participants,
-                "phase_history": [{"phase": "opening", "timestamp": datetime.now()}]
-            }
+            self.meeting_data[meeting_id] = MeetingState(
+                id=meeting_id,
+                start_time=now,
+                start_monotonic=time.monotonic(),
+                agenda=agenda,
+                participants=participants,
+                phase_history=[{"phase": "opening", "timestamp": now}]
+            )
 
             # Initialize participants
             for participant_id in participants:
@@ -79,8 +251,8 @@ class MeetingProcessor:
                 return None
 
             meeting = self.meeting_data[meeting_id]
-            meeting["end_time"] = datetime.now()
-            meeting["duration"] = int((meeting["end_time"] - meeting["start_time"]).total_seconds())
+            meeting.end_time = datetime.now()
+            meeting.duration = int(time.monotonic() - meeting.start_monotonic)
 
             # Cancel auto summary task
             if self.auto_summary_task and not self.auto_summary_task.done():
@@ -90,12 +262,18 @@ class MeetingProcessor:
             summary = await self._generate_final_summary(meeting_id)
 
             # Update phase
-            await self._change_phase("closing")
+            await self._change_phase("closing", meeting.end_time)
 
             self.current_meeting = None
             self.current_phase = "not_started"
 
-            self.ten_env.log_info(f"Meeting {meeting_id} ended, duration: {meeting['duration']} seconds")
+            # Refresh recency and evict the oldest retained meetings
+            self.meeting_data.move_to_end(meeting_id)
+            while len(self.meeting_data) > self._MAX_RETAINED_MEETINGS:
+                evicted_id, _ = self.meeting_data.popitem(last=False)
+                self.ten_env.log_info(f"Evicted retained meeting data for {evicted_id}")
+
+            self.ten_env.log_info(f"Meeting {meeting_id} ended, duration: {meeting.duration} seconds")
             return summary
 
         except Exception as e:
@@ -105,120 +283,130 @@ class MeetingProcessor:
     async def process_asr_result(self, event: ASRResultEvent) -> None:
         """Process ASR results and update meeting state."""
         try:
-            if not self.current_meeting:
+            # Bind the hot lookups once; this runs for every ASR message
+            meeting = self.meeting_data.get(self.current_meeting) if self.current_meeting else None
+            if meeting is None:
                 return
 
-            meeting = self.meeting_data[self.current_meeting]
+            text = event.text
             timestamp = datetime.now()
 
             # Add to transcript buffer
             if event.final:
-                self.transcript_buffer.append((event.text, event.speaker_id or "unknown", timestamp))
-                meeting["transcript"].append({
-                    "text": event.text,
-                    "speaker": event.speaker_id or "unknown",
-                    "timestamp": timestamp,
-                    "final": True
-                })
+                speaker = event.speaker_id or "unknown"
+                self.transcript_buffer.append((text, speaker, timestamp))
+                meeting.transcript_text.append(text)
+                meeting.transcript_speaker.append(speaker)
+                meeting.transcript_ts.append(timestamp)
+                meeting.transcript_final.append(True)
+
+                self._lines_since_summary += 1
+                if self._lines_since_summary >= self._SUMMARY_BATCH_LINES:
+                    self._summary_trigger.set()
 
                 # Update participant stats
-                if event.speaker_id and event.speaker_id in self.participants:
-                    self.participants[event.speaker_id].contributions += 1
-                    # Estimate speaking time (rough approximation)
-                    estimated_time = len(event.text.split()) * 0.5  # ~0.5 seconds per word
-                    self.participants[event.speaker_id].speaking_time += int(estimated_time)
+                participant = self.participants.get(event.speaker_id) if event.speaker_id else None
+                if participant is not None:
+                    participant.contributions += 1
+                    # Estimate speaking time (rough approximation) without
+                    # materializing a word list per utterance
+                    if _CJK_RE.search(text):
+                        estimated_time = len(text) * 0.15  # ~0.15 seconds per character
+                    else:
+                        estimated_time = (text.count(" ") + 1) * 0.5  # ~0.5 seconds per word
+                    participant.speaking_time += int(estimated_time)
+
+                # One keyword scan feeds both phase detection and
+                # key-information extraction
+                categories, phases = self._scan_keywords(text)
 
                 # Detect meeting phase changes
-                await self._detect_phase_change(event.text)
+                await self._detect_phase_change(phases, timestamp)
 
                 # Process for key information
-                await self._process_for_key_information(event.text, timestamp)
+                await self._process_for_key_information(text, timestamp, categories, meeting)
 
             self.last_activity = timestamp
 
         except Exception as e:
             self.ten_env.log_error(f"Failed to process ASR result: {e}")
 
-    async def _detect_phase_change(self, text: str) -> None:
-        """Detect if the meeting phase should change based on the content."""
-        text_lower = text.lower()
-
-        # Phase detection keywords
-        phase_keywords = {
-            "opening": ["开始", "开会", "欢迎", "agenda", "议程"],
-            "discussion": ["讨论", "discuss", "think about", "认为", "观点"],
-            "decision_making": ["决定", "decide", "确定", "同意", "agree"],
-            "action_planning": ["行动", "action", "下一步", "next step", "安排", "plan"],
-            "closing": ["结束", "end", "总结", "summary", "散会"]
-        }
+    async def _detect_phase_change(self, phases: Set[str], ts: Optional[datetime] = None) -> None:
+        """Detect if the meeting phase should change based on scanned phase hits."""
+        if not phases:
+            return
 
-        # Find potential new phase
-        for phase, keywords in phase_keywords.items():
-            if phase != self.current_phase and any(keyword in text_lower for keyword in keywords):
-                # Don't go backwards unless it's closing
-                phase_order = ["opening", "discussion", "decision_making", "action_planning", "closing"]
-                current_index = phase_order.index(self.current_phase) if self.current_phase in phase_order else -1
-                new_index = phase_order.index(phase)
+        current_index = self._PHASE_RANK.get(self.current_phase, -1)
 
-                if new_index > current_index or phase == "closing":
-                    await self._change_phase(phase)
+        # Find potential new phase (tuple order preserves detection priority)
+        for phase in self._PHASE_ORDER:
+            if phase != self.current_phase and phase in phases:
+                # Don't go backwards unless it's closing
+                if self._PHASE_RANK[phase] > current_index or phase == "closing":
+                    await self._change_phase(phase, ts)
                     break
 
-    async def _change_phase(self, new_phase: str) -> None:
+    async def _change_phase(self, new_phase: str, ts: Optional[datetime] = None) -> None:
         """Change the current meeting phase."""
         if new_phase != self.current_phase and self.current_meeting:
             previous_phase = self.current_phase
             self.current_phase = new_phase
 
-            # Record phase change
-            self.meeting_data[self.current_meeting]["phase_history"].append({
+            # Record phase change (ts is the triggering event's timestamp)
+            self.meeting_data[self.current_meeting].phase_history.append({
                 "phase": new_phase,
-                "timestamp": datetime.now()
+                "timestamp": ts or datetime.now()
             })
 
             self.ten_env.log_info(f"Meeting phase changed from {previous_phase} to {new_phase}")
 
-    async def _process_for_key_information(self, text: str, timestamp: datetime) -> None:
+    async def _process_for_key_information(self, text: str, timestamp: datetime, categories: Set[str], meeting: Optional["MeetingState"] = None) -> None:
         """Process text for key information like decisions and action items."""
-        if not self.current_meeting:
-            return
-
-        meeting = self.meeting_data[self.current_meeting]
-        text_lower = text.lower()
+        if meeting is None:
+            if not self.current_meeting:
+                return
+            meeting = self.meeting_data[self.current_meeting]
 
-        # Decision keywords
-        decision_keywords = ["决定", "decide", "确定", "同意", "agree", "resolved", "concluded"]
-        if any(keyword in text_lower for keyword in decision_keywords):
-            meeting["decisions"].append({
+        if "decision" in categories:
+            meeting.decisions.append({
                 "decision": text,
                 "timestamp": timestamp,
                 "phase": self.current_phase
             })
 
-        # Action item keywords
-        action_keywords = ["需要", "should", "will do", "负责", "安排", "plan to", "action"]
-        if any(keyword in text_lower for keyword in action_keywords):
+        if "action" in categories:
             # This is a candidate for action item, will be processed by ActionExtractor
             pass
 
-        # Key point keywords
-        key_keywords = ["重要", "important", "关键", "key", "crucial", "主要"]
-        if any(keyword in text_lower for keyword in key_keywords):
-            meeting["key_points"].append({
+        if "key" in categories:
+            meeting.key_points.append({
                 "point": text,
                 "timestamp": timestamp,
                 "phase": self.current_phase
             })
 
     async def _auto_summary_loop(self) -> None:
-        """Auto-generate summaries at regular intervals."""
+        """Auto-generate summaries when enough new content accumulates."""
         try:
             while self.current_meeting:
-                await asyncio.sleep(self.summary_interval)
+                # Wake early on a burst of new lines, or at the interval
+                try:
+                    await asyncio.wait_for(self._summary_trigger.wait(), timeout=self.summary_interval)
+                except asyncio.TimeoutError:
+                    pass
+                self._summary_trigger.clear()
+
+                if not self.current_meeting:
+                    break
+
+                # Nothing new since the last summary: skip the idle tick
+                if self._lines_since_summary == 0:
+                    continue
+                self._lines_since_summary = 0
 
-                if self.current_meeting and self.transcript_buffer:
+                if self.transcript_buffer:
                     # Generate real-time summary
-                    recent_text = " ".join([item[0] for item in self.transcript_buffer[-10:]])
+                    recent_text = " ".join(item[0] for item in self.transcript_buffer)
                     if recent_text.strip():
                         # This would trigger summary generation
                         await self._emit_summary_request("real_time", recent_text)
@@ -243,7 +431,7 @@ class MeetingProcessor:
 
             # Create action items from collected data
             action_items = []
-            for item in meeting.get("action_items", []):
+            for item in meeting.action_items:
                 action_items.append(ActionItem(
                     id=str(uuid.uuid4()),
                     action=item.get("action", ""),
@@ -259,18 +447,18 @@ class MeetingProcessor:
             # Create participant list
             participants = [
                 self.participants.get(p_id, MeetingParticipant(id=p_id, name=p_id))
-                for p_id in meeting.get("participants", [])
+                for p_id in meeting.participants
             ]
 
             summary = MeetingSummary(
                 meeting_id=meeting_id,
                 title=f"Meeting {meeting_id}",
-                date=meeting["start_time"],
-                duration=meeting.get("duration", 0),
+                date=meeting.start_time,
+                duration=meeting.duration,
                 participants=participants,
-                agenda=meeting.get("agenda"),
-                key_points=[item["point"] for item in meeting.get("key_points", [])],
-                decisions=[item["decision"] for item in meeting.get("decisions", [])],
+                agenda=meeting.agenda,
+                key_points=[item["point"] for item in meeting.key_points],
+                decisions=[item["decision"] for item in meeting.decisions],
                 action_items=action_items,
                 next_steps=[],  # Would be generated by AI
                 summary=""  # Would be generated by AI
@@ -293,59 +481,75 @@ class MeetingProcessor:
             "meeting_id": self.current_meeting,
             "phase": self.current_phase,
             "phase_description": self.phases.get(self.current_phase, "未知阶段"),
-            "duration": int((datetime.now() - meeting["start_time"]).total_seconds()),
+            "duration": int(time.monotonic() - meeting.start_monotonic),
             "participants": len(self.participants),
-            "transcript_items": len(meeting.get("transcript", [])),
-            "key_points": len(meeting.get("key_points", [])),
-            "decisions": len(meeting.get("decisions", [])),
-            "action_items": len(meeting.get("action_items", []))
+            "transcript_items": len(meeting.transcript_text),
+            "key_points": len(meeting.key_points),
+            "decisions": len(meeting.decisions),
+            "action_items": len(meeting.action_items)
         }
 
     async def export_meeting_data(self, meeting_id: str, format: str = "json") -> Optional[str]:
         """Export meeting data in specified format."""
         try:
-            if meeting_id not in self.meeting_data:
+            meeting = self.meeting_data.get(meeting_id)
+            if meeting is None:
                 return None
 
-            meeting = self.meeting_data[meeting_id]
-
-            if format == "txt":
-                # Generate text format
-                lines = [
-                    f"会议记录 - {meeting_id}",
-                    f"开始时间: {meeting['start_time']}",
-                    f"议程: {meeting.get('agenda', '无')}",
-                    "",
-                    "== 会议转录 ==",
-                ]
+            # Snapshot the mutable parts so ongoing ASR appends cannot
+            # race with the worker thread rendering them
+            snapshot = dataclasses.replace(
+                meeting,
+                transcript_text=meeting.transcript_text[:],
+                transcript_speaker=meeting.transcript_speaker[:],
+                transcript_ts=meeting.transcript_ts[:],
+                transcript_final=meeting.transcript_final[:],
+                key_points=list(meeting.key_points),
+                decisions=list(meeting.decisions),
+            )
 
-                for item in meeting.get("transcript", []):
-                    lines.append(f"[{item['timestamp']}] {item['speaker']}: {item['text']}")
+            # Rendering a long meeting can block the loop for tens of ms;
+            # hand it to a worker thread so ASR processing keeps flowing
+            return await asyncio.to_thread(self._export_sync, snapshot, meeting_id, format)
 
-                lines.extend([
-                    "",
-                    "== 关键要点 ==",
-                ])
+        except Exception as e:
+            self.ten_env.log_error(f"Failed to export meeting data: {e}")
+            return None
 
-                for item in meeting.get("key_points", []):
-                    lines.append(f"- {item['point']}")
+    @staticmethod
+    def _export_sync(meeting: "MeetingState", meeting_id: str, format: str) -> Optional[str]:
+        """Render an export snapshot; runs on a worker thread."""
+        if format == "txt":
+            # Generate text format in one growing buffer instead of a
+            # line list joined at the end
+            buf = io.StringIO()
+            buf.write(
+                f"会议记录 - {meeting_id}\n"
+                f"开始时间: {meeting.start_time}\n"
+                f"议程: {meeting.agenda if meeting.agenda is not None else '无'}\n"
+                "\n"
+                "== 会议转录 ==\n"
+            )
 
-                lines.extend([
-                    "",
-                    "== 决策事项 ==",
-                ])
+            buf.writelines(
+                f"[{ts}] {speaker}: {text}\n"
+                for ts, speaker, text in zip(meeting.transcript_ts, meeting.transcript_speaker, meeting.transcript_text)
+            )
 
-                for item in meeting.get("decisions", []):
-                    lines.append(f"- {item['decision']}")
+            buf.write("\n== 关键要点 ==\n")
+            buf.writelines(f"- {item['point']}\n" for item in meeting.key_points)
 
-                return "\n".join(lines)
+            buf.write("\n== 决策事项 ==\n")
+            buf.writelines(f"- {item['decision']}\n" for item in meeting.decisions)
 
-            elif format == "json":
-                import json
-                return json.dumps(meeting, default=str, ensure_ascii=False, indent=2)
+            # Writes all end with a newline; the old join had none at the end
+            return buf.getvalue()[:-1]
 
-            return None
+        elif format == "json":
+            # orjson serializes dataclasses and datetimes in C;
+            # default=str only runs for the odd non-native value
+            if orjson is not None:
+                return orjson.dumps(meeting, default=str, option=orjson.OPT_INDENT_2).decode()
+            return json.dumps(dataclasses.asdict(meeting), default=str, ensure_ascii=False, indent=2)
 
-        except Exception as e:
-            self.ten_env.log_error(f"Failed to export meeting data: {e}")
-            return None
\ No newline at end of file
+        return None
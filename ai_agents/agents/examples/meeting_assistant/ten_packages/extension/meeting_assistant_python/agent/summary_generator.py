@@ -1,18 +1,41 @@
 import asyncio
+import hashlib
+import json
+import time
+from collections import OrderedDict
 from datetime import datetime
 from typing import Dict, List, Optional, Tuple
 from ten_runtime import AsyncTenEnv
 from .events import SummaryGeneratedEvent, MeetingSummary
 from .llm_exec import LLMExec
 
+try:
+    import orjson
+except ImportError:  # stdlib json is the fallback
+    orjson = None
+
 
 class SummaryGenerator:
     """Generator for meeting summaries at different levels."""
 
+    # An unchanged transcript tail or a re-entered phase produces the very
+    # same prompt; serving it from cache skips a whole LLM round-trip.
+    _LLM_CACHE_TTL = 300.0  # seconds
+    _LLM_CACHE_CAP = 256
+
+    # Meetings whose summaries stay resident; older ones are evicted
+    _MAX_RETAINED_MEETINGS = 16
+
     def __init__(self, ten_env: AsyncTenEnv, llm_exec: LLMExec):
         self.ten_env = ten_env
         self.llm_exec = llm_exec
-        self.summary_cache: Dict[str, Dict] = {}
+        self.summary_cache: OrderedDict = OrderedDict()  # meeting_id -> summaries, LRU-bounded
+        self._llm_cache: OrderedDict = OrderedDict()  # prompt digest -> (monotonic ts, summary)
+        # Serializes the on_response swap window below: overlapping summary
+        # calls would otherwise save each other's capture hook as the
+        # "previous" handler and restore it on exit, permanently replacing
+        # the agent's conversational callback.
+        self._llm_call_lock = asyncio.Lock()
         self.summary_prompts = {
             "real_time": """
 请根据以下会议对话内容，生成一个简洁的实时总结（不超过100字）：
@@ -88,6 +111,15 @@ class SummaryGenerator:
 行动项清单："""
         }
 
+    def _meeting_cache(self, meeting_id: str) -> Dict:
+        """Get (or create) a meeting's summary bucket, refreshing recency."""
+        cache = self.summary_cache.setdefault(meeting_id, {})
+        self.summary_cache.move_to_end(meeting_id)
+        while len(self.summary_cache) > self._MAX_RETAINED_MEETINGS:
+            evicted_id, _ = self.summary_cache.popitem(last=False)
+            self.ten_env.log_info(f"Evicted cached summaries for {evicted_id}")
+        return cache
+
     async def generate_real_time_summary(self, content: str, meeting_id: str) -> Optional[SummaryGeneratedEvent]:
         """Generate real-time summary from recent conversation."""
         try:
@@ -106,9 +138,7 @@ class SummaryGenerator:
                 )
 
                 # Cache the summary
-                if meeting_id not in self.summary_cache:
-                    self.summary_cache[meeting_id] = {"real_time": []}
-                self.summary_cache[meeting_id]["real_time"].append({
+                self._meeting_cache(meeting_id).setdefault("real_time", []).append({
                     "content": summary,
                     "timestamp": datetime.now(),
                     "source_content": content[:200] + "..." if len(content) > 200 else content
@@ -143,12 +173,7 @@ class SummaryGenerator:
                 )
 
                 # Cache the summary
-                if meeting_id not in self.summary_cache:
-                    self.summary_cache[meeting_id] = {}
-                if "sections" not in self.summary_cache[meeting_id]:
-                    self.summary_cache[meeting_id]["sections"] = {}
-
-                self.summary_cache[meeting_id]["sections"][section] = {
+                self._meeting_cache(meeting_id).setdefault("sections", {})[section] = {
                     "content": summary,
                     "timestamp": datetime.now(),
                     "source_length": len(content)
@@ -194,10 +219,7 @@ class SummaryGenerator:
                 )
 
                 # Cache the final summary
-                if meeting_summary.meeting_id not in self.summary_cache:
-                    self.summary_cache[meeting_summary.meeting_id] = {}
-
-                self.summary_cache[meeting_summary.meeting_id]["final"] = {
+                self._meeting_cache(meeting_summary.meeting_id)["final"] = {
                     "content": summary,
                     "timestamp": datetime.now(),
                     "meeting_duration": meeting_summary.duration,
@@ -219,10 +241,7 @@ class SummaryGenerator:
 
             if action_summary:
                 # Cache action summary
-                if meeting_id not in self.summary_cache:
-                    self.summary_cache[meeting_id] = {}
-
-                self.summary_cache[meeting_id]["actions"] = {
+                self._meeting_cache(meeting_id)["actions"] = {
                     "content": action_summary,
                     "timestamp": datetime.now(),
                     "source_length": len(content)
@@ -268,35 +287,57 @@ class SummaryGenerator:
             self.ten_env.log_error(f"Failed to get progressive summary: {e}")
             return None
 
+    # Upper bound on one summary generation; fast completions return as
+    # soon as the final response lands instead of padding to a fixed sleep.
+    _LLM_TIMEOUT = 30.0
+
     async def _call_llm_for_summary(self, prompt: str) -> Optional[str]:
         """Call LLM to generate summary."""
         try:
-            # Store current context
-            original_context = self.llm_exec.get_context().copy() if hasattr(self.llm_exec, 'get_context') else []
+            cache_key = hashlib.blake2b(prompt.encode("utf-8"), digest_size=16).digest()
+            now_ts = time.monotonic()
+            cached = self._llm_cache.get(cache_key)
+            if cached is not None and now_ts - cached[0] < self._LLM_CACHE_TTL:
+                self._llm_cache.move_to_end(cache_key)
+                return cached[1]
+
+            async with self._llm_call_lock:
+                # A concurrent caller may have produced this summary while
+                # we waited for the lock.
+                cached = self._llm_cache.get(cache_key)
+                if cached is not None and time.monotonic() - cached[0] < self._LLM_CACHE_TTL:
+                    self._llm_cache.move_to_end(cache_key)
+                    return cached[1]
+
+                # Capture the final response through a future instead of
+                # sleeping a fixed interval and returning a placeholder.
+                # Summary traffic is not forwarded to the conversational
+                # handler; it is restored once the summary completes.
+                future = asyncio.get_running_loop().create_future()
+                previous_on_response = self.llm_exec.on_response
+
+                async def capture(_ten_env, _delta: str, text: str, is_final: bool):
+                    if is_final and not future.done():
+                        future.set_result(text)
+
+                self.llm_exec.on_response = capture
+                try:
+                    await self.llm_exec.queue_input(prompt)
+                    summary = await asyncio.wait_for(future, timeout=self._LLM_TIMEOUT)
+                finally:
+                    self.llm_exec.on_response = previous_on_response
 
-            # Clear context for summary generation
-            if hasattr(self.llm_exec, 'clear_context'):
-                self.llm_exec.clear_context()
-
-            # Add summary prompt
-            await self.llm_exec.queue_input(prompt)
-            await self.llm_exec.flush()
-
-            # Wait for response (this is a simplified approach)
-            # In a real implementation, this would be handled through the event system
-            await asyncio.sleep(2)  # Give time for LLM to process
-
-            # Get the last response
-            # This is a placeholder - actual implementation would capture the LLM response
-            summary = "摘要生成完成，请查看详细内容。"  # Placeholder
-
-            # Restore original context
-            if hasattr(self.llm_exec, 'set_context') and original_context:
-                for msg in original_context:
-                    await self.llm_exec.queue_input(msg.get('content', ''))
+            if summary:
+                self._llm_cache[cache_key] = (now_ts, summary)
+                self._llm_cache.move_to_end(cache_key)
+                while len(self._llm_cache) > self._LLM_CACHE_CAP:
+                    self._llm_cache.popitem(last=False)
 
             return summary
 
+        except asyncio.TimeoutError:
+            self.ten_env.log_error("LLM summary generation timed out")
+            return None
         except Exception as e:
             self.ten_env.log_error(f"LLM summary generation failed: {e}")
             return None
@@ -344,7 +385,8 @@ class SummaryGenerator:
                 return "\n".join(lines)
 
             elif format == "json":
-                import json
+                if orjson is not None:
+                    return orjson.dumps(cache, default=str, option=orjson.OPT_INDENT_2).decode()
                 return json.dumps(cache, default=str, ensure_ascii=False, indent=2)
 
             return None
@@ -360,17 +402,26 @@ class SummaryGenerator:
 
         cache = self.summary_cache[meeting_id]
 
+        # Track the newest timestamp inline rather than materializing a
+        # nested comprehension just to call max() on it
+        last_update = datetime.min
+        for section in cache.values():
+            if isinstance(section, list):
+                for item in section:
+                    if isinstance(item, dict):
+                        ts = item.get("timestamp")
+                        if ts is not None and ts > last_update:
+                            last_update = ts
+            elif isinstance(section, dict):
+                ts = section.get("timestamp")
+                if ts is not None and ts > last_update:
+                    last_update = ts
+
         return {
             "meeting_id": meeting_id,
             "real_time_summaries": len(cache.get("real_time", [])),
             "section_summaries": len(cache.get("sections", {})),
             "has_final_summary": "final" in cache,
             "has_action_summary": "actions" in cache,
-            "last_update": max([
-                item.get("timestamp", datetime.min)
-                for section in cache.values()
-                if isinstance(section, (list, dict))
-                for item in (section if isinstance(section, list) else [section])
-                if isinstance(item, dict)
-            ], default=datetime.min)
+            "last_update": last_update
         }
\ No newline at end of file
@@ -1,5 +1,7 @@
-from pydantic import BaseModel
-from typing import Dict, List, Optional
+import functools
+
+from pydantic import BaseModel, Field
+from typing import Dict, Optional, Tuple
 
 
 class MeetingConfig(BaseModel):
@@ -15,23 +17,25 @@ class MeetingConfig(BaseModel):
 
 class CalendarIntegrationConfig(BaseModel):
     """Calendar integration configuration."""
-    google_calendar: Dict = {
+    # default_factory builds each instance's dict directly instead of
+    # deep-copying a shared class-level default on every construction
+    google_calendar: Dict = Field(default_factory=lambda: {
         "enabled": False,
         "credentials_path": "",
         "calendar_id": "primary"
-    }
-    outlook_calendar: Dict = {
+    })
+    outlook_calendar: Dict = Field(default_factory=lambda: {
         "enabled": False,
         "client_id": "",
         "client_secret": "",
         "tenant_id": ""
-    }
-    webhook_calendar: Dict = {
+    })
+    webhook_calendar: Dict = Field(default_factory=lambda: {
         "enabled": False,
         "webhook_url": "",
         "headers": {},
         "auth_token": ""
-    }
+    })
 
 
 class LLMPromptsConfig(BaseModel):
@@ -74,31 +78,32 @@ class LLMPromptsConfig(BaseModel):
 class NotificationConfig(BaseModel):
     """Notification configuration."""
     enable_email_notifications: bool = False
-    email_settings: Dict = {
+    email_settings: Dict = Field(default_factory=lambda: {
         "smtp_server": "",
         "smtp_port": 587,
         "username": "",
         "password": "",
         "from_email": ""
-    }
+    })
     enable_slack_notifications: bool = False
-    slack_settings: Dict = {
+    slack_settings: Dict = Field(default_factory=lambda: {
         "webhook_url": "",
         "channel": "#meetings",
         "bot_token": ""
-    }
+    })
     enable_webhook_notifications: bool = False
-    webhook_settings: Dict = {
+    webhook_settings: Dict = Field(default_factory=lambda: {
         "url": "",
         "headers": {},
         "auth_token": ""
-    }
+    })
 
 
 class ExportConfig(BaseModel):
     """Export configuration."""
     default_export_format: str = "markdown"
-    supported_formats: List[str] = ["markdown", "json", "txt", "pdf"]
+    # Tuples: immutable, so pydantic reuses the default without copying
+    supported_formats: Tuple[str, ...] = ("markdown", "json", "txt", "pdf")
     auto_export_on_meeting_end: bool = True
     export_location: str = "./meeting_exports"
     include_timestamps: bool = True
@@ -124,16 +129,16 @@ class MeetingAssistantConfig(BaseModel):
     version: str = "1.0.0"
 
     # Core functionality
-    meeting: MeetingConfig = MeetingConfig()
-    calendar_integration: CalendarIntegrationConfig = CalendarIntegrationConfig()
-    llm_prompts: LLMPromptsConfig = LLMPromptsConfig()
-    notifications: NotificationConfig = NotificationConfig()
-    export: ExportConfig = ExportConfig()
-    security: SecurityConfig = SecurityConfig()
+    meeting: MeetingConfig = Field(default_factory=MeetingConfig)
+    calendar_integration: CalendarIntegrationConfig = Field(default_factory=CalendarIntegrationConfig)
+    llm_prompts: LLMPromptsConfig = Field(default_factory=LLMPromptsConfig)
+    notifications: NotificationConfig = Field(default_factory=NotificationConfig)
+    export: ExportConfig = Field(default_factory=ExportConfig)
+    security: SecurityConfig = Field(default_factory=SecurityConfig)
 
     # Language settings
     default_language: str = "zh-CN"
-    supported_languages: List[str] = ["zh-CN", "en-US", "ja-JP", "ko-KR"]
+    supported_languages: Tuple[str, ...] = ("zh-CN", "en-US", "ja-JP", "ko-KR")
 
     # UI settings
     enable_real_time_display: bool = True
@@ -145,13 +150,13 @@ class MeetingAssistantConfig(BaseModel):
     enable_meeting_history: bool = True
     history_retention_days: int = 90
     enable_cloud_backup: bool = False
-    cloud_backup_settings: Dict = {
+    cloud_backup_settings: Dict = Field(default_factory=lambda: {
         "provider": "aws_s3",
         "bucket": "",
         "region": "",
         "access_key": "",
         "secret_key": ""
-    }
+    })
 
     # Performance settings
     max_concurrent_meetings: int = 5
@@ -168,3 +173,15 @@ class MeetingAssistantConfig(BaseModel):
 
 # For backward compatibility
 MainControlConfig = MeetingAssistantConfig
+
+
+@functools.lru_cache(maxsize=8)
+def load_config(config_json: str) -> MeetingAssistantConfig:
+    """Parse a runtime-property payload into a validated config.
+
+    Validation of the seven nested models dominates extension startup;
+    caching on the raw JSON string means repeated instantiations with an
+    identical payload (the common case) reuse the parsed instance. The
+    config is treated as read-only after load, so sharing is safe.
+    """
+    return MeetingAssistantConfig.model_validate_json(config_json)
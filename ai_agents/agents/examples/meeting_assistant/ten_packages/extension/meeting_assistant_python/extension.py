@@ -1,7 +1,10 @@
 import asyncio
+import functools
+import itertools
 import json
 import time
-from typing import Literal
+from collections import deque
+from typing import Deque, Literal, Optional
 
 from .agent.decorators import agent_event_handler
 from ten_runtime import (
@@ -25,9 +28,30 @@ from .agent.events import (
     CalendarEventEvent,
 )
 from .helper import _send_cmd, _send_data, parse_sentences
-from .config import MeetingAssistantConfig
+from .config import MeetingAssistantConfig, load_config
 
-import uuid
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional accelerator
+    orjson = None
+
+
+# Prompt skeleton for the end-of-meeting summary; rows are joined in a
+# single pass so the transcript is copied once into the final string.
+_SUMMARY_HEADER = "请根据以下会议转录内容生成简洁的总结：\n\n"
+_SUMMARY_FOOTER_FMT = """
+请按以下格式输出：
+1. 主要讨论点：
+2. 关键决策：
+3. 行动项目：
+4. 会议时长：约{n}个发言轮次"""
+
+
+def _reasoning_payload(text: str) -> str:
+    """Serialize the inner reasoning wrapper sent on every LLM delta."""
+    if orjson is not None:
+        return orjson.dumps({"type": "reasoning", "data": {"text": text}}).decode()
+    return json.dumps({"type": "reasoning", "data": {"text": text}})
 
 
 class MeetingAssistantExtension(AsyncExtension):
@@ -37,6 +61,10 @@ class MeetingAssistantExtension(AsyncExtension):
     and calendar scheduling.
     """
 
+    # Generous for a max_meeting_duration-length session at conversational
+    # turn rates; older lines roll off rather than growing unbounded.
+    _MAX_STORED_TRANSCRIPTS = 4096
+
     def __init__(self, name: str):
         super().__init__(name)
         self.ten_env: AsyncTenEnv = None
@@ -45,10 +73,37 @@ class MeetingAssistantExtension(AsyncExtension):
 
         self.stopped: bool = False
         self._rtc_user_count: int = 0
+
+        # Columnar transcript store: three scalar pushes per ASR final
+        # instead of one dict allocation, bounded so a marathon meeting
+        # cannot grow memory without limit.
+        self._tr_texts: Deque[str] = deque(maxlen=self._MAX_STORED_TRANSCRIPTS)
+        self._tr_ts: Deque[int] = deque(maxlen=self._MAX_STORED_TRANSCRIPTS)  # ms epoch
+        self._tr_turn: Deque[int] = deque(maxlen=self._MAX_STORED_TRANSCRIPTS)
         self.sentence_fragment: str = ""
         self.turn_id: int = 0
         self.session_id: str = "0"
         self.meeting_active: bool = False
+        self._summary_mode: bool = False
+        # flush_id only needs local uniqueness; a counter avoids the
+        # os.urandom read and 36-char formatting of uuid4 per interrupt
+        self._flush_ids = itertools.count(1)
+        self._pending_end_task: Optional[asyncio.Task] = None
+        self._notif_batch: list = []
+        self._notif_event = asyncio.Event()
+        self._notif_flusher_task: Optional[asyncio.Task] = None
+
+        # Reused payload buffer for the hot transcript path: _send_data
+        # serializes the payload before its first await, so the buffer is
+        # free again by the time control returns to the event loop.
+        self._transcript_payload: dict = {
+            "data_type": "transcribe",
+            "role": "",
+            "text": "",
+            "text_ts": 0,
+            "is_final": False,
+            "stream_id": 0,
+        }
 
     def _current_metadata(self) -> dict:
         return {"session_id": self.session_id, "turn_id": self.turn_id}
@@ -58,21 +113,39 @@ class MeetingAssistantExtension(AsyncExtension):
 
         # Load config from runtime properties
         config_json, _ = await ten_env.get_property_to_json(None)
-        self.config = MeetingAssistantConfig.model_validate_json(config_json)
+        self.config = load_config(config_json)
 
         self.agent = MeetingAgent(ten_env)
 
         # Now auto-register decorated methods
-        for attr_name in dir(self):
-            fn = getattr(self, attr_name)
-            event_type = getattr(fn, "_agent_event_type", None)
-            if event_type:
-                self.agent.on(event_type, fn)
+        for event_type, attr_name in self._handler_map():
+            self.agent.on(event_type, getattr(self, attr_name))
+
+    @classmethod
+    @functools.cache
+    def _handler_map(cls) -> tuple:
+        """(event_type, method name) pairs for decorated handlers.
+
+        Handlers are class-level, so the dir()-walk over 40+ inherited
+        attributes happens once per class instead of on every on_init;
+        instances only pay the getattr bindings for actual handlers.
+        """
+        return tuple(
+            (event_type, attr_name)
+            for attr_name in dir(cls)
+            if (event_type := getattr(getattr(cls, attr_name), "_agent_event_type", None))
+        )
 
     # === Register handlers with decorators ===
     @agent_event_handler(UserJoinedEvent)
     async def _on_user_joined(self, event: UserJoinedEvent):
         self._rtc_user_count += 1
+
+        # 用户重连时取消延迟结束任务
+        if self._pending_end_task is not None:
+            self._pending_end_task.cancel()
+            self._pending_end_task = None
+            self.ten_env.log_info("User rejoined, continuing meeting")
         # 禁用初始问候语，静默模式
         # if self._rtc_user_count == 1 and self.config and self.config.greeting:
         #     await self._send_to_tts(self.config.greeting, True)
@@ -90,16 +163,26 @@ class MeetingAssistantExtension(AsyncExtension):
         self._rtc_user_count -= 1
 
         # Auto-end meeting if all users left (with delay to avoid interruptions)
-        if self._rtc_user_count == 0 and self.meeting_active:
-            # 添加延迟，避免暂停时误触发
-            import asyncio
-            await asyncio.sleep(10)  # 等待10秒
-            # 再次检查用户数量，如果仍然为0才结束会议
+        if self._rtc_user_count == 0 and self.meeting_active and self._pending_end_task is None:
+            # 添加延迟，避免暂停时误触发；用户重连时直接取消任务
+            self._pending_end_task = asyncio.create_task(self._delayed_end_meeting())
+
+    # Grace period before auto-ending an empty meeting, so a brief
+    # disconnect does not tear the session down.
+    _END_MEETING_GRACE = 10.0
+
+    async def _delayed_end_meeting(self):
+        """End the meeting after the grace period unless cancelled by a rejoin."""
+        try:
+            await asyncio.sleep(self._END_MEETING_GRACE)
             if self._rtc_user_count == 0 and self.meeting_active:
                 self.ten_env.log_info("All users left for 10 seconds, ending meeting")
                 await self._end_meeting()
-            else:
-                self.ten_env.log_info("User rejoined, continuing meeting")
+        finally:
+            # Only clear our own reference; a rejoin may already have
+            # cancelled us and scheduled a successor task.
+            if self._pending_end_task is asyncio.current_task():
+                self._pending_end_task = None
 
     @agent_event_handler(ToolRegisterEvent)
     async def _on_tool_register(self, event: ToolRegisterEvent):
@@ -111,6 +194,8 @@ class MeetingAssistantExtension(AsyncExtension):
         stream_id = int(self.session_id)
         if not event.text:
             return
+        # One clock read shared by the store and the transcript send
+        ts_ms = time.time_ns() // 1_000_000
         if event.final or len(event.text) > 2:
             await self._interrupt()
         if event.final:
@@ -119,22 +204,16 @@ class MeetingAssistantExtension(AsyncExtension):
             # await self.agent.queue_llm_input(event.text)
 
             # 存储转录内容用于后续总结
-            if not hasattr(self, 'stored_transcripts'):
-                self.stored_transcripts = []
-            self.stored_transcripts.append({
-                'text': event.text,
-                'timestamp': time.time(),
-                'turn_id': self.turn_id
-            })
+            self._tr_texts.append(event.text)
+            self._tr_ts.append(ts_ms)
+            self._tr_turn.append(self.turn_id)
 
-        await self._send_transcript("user", event.text, event.final, stream_id)
+        await self._send_transcript("user", event.text, event.final, stream_id, ts_ms=ts_ms)
 
     @agent_event_handler(LLMResponseEvent)
     async def _on_llm_response(self, event: LLMResponseEvent):
         # 检查是否为总结模式
-        is_summary_mode = getattr(self, '_summary_mode', False)
-
-        if is_summary_mode:
+        if self._summary_mode:
             # 总结模式下启用输出
             if not event.is_final and event.type == "message":
                 sentences, self.sentence_fragment = parse_sentences(
@@ -213,10 +292,14 @@ class MeetingAssistantExtension(AsyncExtension):
 
     async def on_start(self, ten_env: AsyncTenEnv):
         ten_env.log_info("[MainControlExtension] on_start")
+        self._notif_flusher_task = asyncio.create_task(self._notif_flusher())
 
     async def on_stop(self, ten_env: AsyncTenEnv):
         ten_env.log_info("[MainControlExtension] on_stop")
         self.stopped = True
+        if self._notif_flusher_task is not None:
+            self._notif_flusher_task.cancel()
+        await self._flush_notifications()
         await self.agent.stop()
 
     async def on_cmd(self, ten_env: AsyncTenEnv, cmd: Cmd):
@@ -233,45 +316,24 @@ class MeetingAssistantExtension(AsyncExtension):
         final: bool,
         stream_id: int,
         data_type: Literal["text", "reasoning"] = "text",
+        ts_ms: Optional[int] = None,
     ):
         """
         Sends the transcript (ASR or LLM output) to the message collector.
         """
+        payload = self._transcript_payload
+        payload["role"] = role
+        payload["text_ts"] = ts_ms if ts_ms is not None else time.time_ns() // 1_000_000
+        payload["is_final"] = final
+        payload["stream_id"] = stream_id
         if data_type == "text":
-            await _send_data(
-                self.ten_env,
-                "message",
-                "message_collector",
-                {
-                    "data_type": "transcribe",
-                    "role": role,
-                    "text": text,
-                    "text_ts": int(time.time() * 1000),
-                    "is_final": final,
-                    "stream_id": stream_id,
-                },
-            )
+            payload["data_type"] = "transcribe"
+            payload["text"] = text
+            await _send_data(self.ten_env, "message", "message_collector", payload)
         elif data_type == "reasoning":
-            await _send_data(
-                self.ten_env,
-                "message",
-                "message_collector",
-                {
-                    "data_type": "raw",
-                    "role": role,
-                    "text": json.dumps(
-                        {
-                            "type": "reasoning",
-                            "data": {
-                                "text": text,
-                            },
-                        }
-                    ),
-                    "text_ts": int(time.time() * 1000),
-                    "is_final": final,
-                    "stream_id": stream_id,
-                },
-            )
+            payload["data_type"] = "raw"
+            payload["text"] = _reasoning_payload(text)
+            await _send_data(self.ten_env, "message", "message_collector", payload)
         self.ten_env.log_info(
             f"[MainControlExtension] Sent transcript: {role}, final={final}, text={text}"
         )
@@ -303,7 +365,8 @@ class MeetingAssistantExtension(AsyncExtension):
         self.sentence_fragment = ""
         await self.agent.flush_llm()
         await _send_data(
-            self.ten_env, "tts_flush", "tts", {"flush_id": str(uuid.uuid4())}
+            self.ten_env, "tts_flush", "tts",
+            {"flush_id": f"{self.session_id}-{next(self._flush_ids)}"}
         )
         await _send_cmd(self.ten_env, "flush", "agora_rtc")
         self.ten_env.log_info("[MainControlExtension] Interrupt signal sent")
@@ -330,27 +393,20 @@ class MeetingAssistantExtension(AsyncExtension):
                 self.meeting_active = False
                 self.ten_env.log_info("Meeting ended")
 
+            # Deliver any queued notifications before the session winds down
+            await self._flush_notifications()
+
     async def _generate_meeting_summary(self):
         """生成会议总结并发送TTS和转录"""
         try:
             # 检查是否有存储的转录内容
-            if hasattr(self, 'stored_transcripts') and self.stored_transcripts:
-                # 整理转录内容
-                transcript_text = "\n".join([
-                    f"[{i+1}] {item['text']}"
-                    for i, item in enumerate(self.stored_transcripts)
-                ])
-
-                # 构建总结请求
-                summary_prompt = f"""请根据以下会议转录内容生成简洁的总结：
-
-{transcript_text}
-
-请按以下格式输出：
-1. 主要讨论点：
-2. 关键决策：
-3. 行动项目：
-4. 会议时长：约{len(self.stored_transcripts)}个发言轮次"""
+            turn_count = len(self._tr_texts)
+            if turn_count:
+                # 构建总结请求：单次 join 生成完整提示词
+                parts = [_SUMMARY_HEADER]
+                parts.extend(f"[{i}] {text}\n" for i, text in enumerate(self._tr_texts, 1))
+                parts.append(_SUMMARY_FOOTER_FMT.format(n=turn_count))
+                summary_prompt = "".join(parts)
 
                 # 单次请求生成总结
                 await self.agent.queue_llm_input(summary_prompt)
@@ -359,25 +415,45 @@ class MeetingAssistantExtension(AsyncExtension):
                 self._summary_mode = True
 
                 # 发送初始通知
-                initial_text = f"会议已结束，共记录{len(self.stored_transcripts)}条发言。正在生成总结报告..."
+                initial_text = f"会议已结束，共记录{turn_count}条发言。正在生成总结报告..."
             else:
                 initial_text = "会议已结束，但未记录到发言内容。"
 
             await self._send_to_tts(initial_text, True)
             await self._send_transcript("assistant", initial_text, True, 100)
 
-            self.ten_env.log_info(f"[MeetingAssistant] Meeting summary generation triggered with {len(getattr(self, 'stored_transcripts', []))} transcripts")
+            self.ten_env.log_info(f"[MeetingAssistant] Meeting summary generation triggered with {turn_count} transcripts")
         except Exception as e:
             self.ten_env.log_error(f"[MeetingAssistant] Error generating summary: {e}")
 
+    # Bursts (action items plus summaries landing together) coalesce
+    # into one dispatch per window instead of two sends per notification.
+    _NOTIF_FLUSH_INTERVAL = 0.1
+
     async def _send_meeting_notification(self, title: str, content: str):
-        """Send meeting notification to the UI."""
-        notification_text = f"[{title}] {content}"
+        """Queue a meeting notification; the flusher coalesces bursts."""
+        self._notif_batch.append((title, content))
+        self._notif_event.set()
+
+    async def _notif_flusher(self):
+        """Drain queued notifications once per flush window."""
+        while not self.stopped:
+            await self._notif_event.wait()
+            self._notif_event.clear()
+            # Let the rest of the burst arrive before flushing
+            await asyncio.sleep(self._NOTIF_FLUSH_INTERVAL)
+            await self._flush_notifications()
+
+    async def _flush_notifications(self):
+        """Send all queued notifications as a single batch."""
+        if not self._notif_batch:
+            return
+        batch, self._notif_batch = self._notif_batch, []
 
-        # Send as transcript message
+        # One transcript message for the whole batch (system stream)
         await self._send_transcript(
             "system",
-            notification_text,
+            "\n".join(f"[{title}] {content}" for title, content in batch),
             True,
             200,  # Different stream ID for system messages
             data_type="text"
@@ -386,13 +462,14 @@ class MeetingAssistantExtension(AsyncExtension):
         # Also send as raw data for UI handling
         await _send_data(
             self.ten_env,
-            "meeting_notification",
+            "meeting_notification_batch",
             "message_collector",
             {
-                "notification_type": "meeting",
-                "title": title,
-                "content": content,
-                "timestamp": int(time.time() * 1000),
+                "notification_type": "meeting_batch",
+                "notifications": [
+                    {"title": title, "content": content} for title, content in batch
+                ],
+                "timestamp": time.time_ns() // 1_000_000,
                 "meeting_active": self.meeting_active,
             },
         )